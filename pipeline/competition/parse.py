@@ -1,11 +1,12 @@
 import requests
 from bs4 import BeautifulSoup
 import re
-import time
 from typing import List, Dict, Any, Optional
 from urllib.parse import urljoin
 from pipeline.utils.logging import get_logger
-from pipeline.utils.cache import CacheManager
+from pipeline.utils.cache import get_cache_manager
+from pipeline.utils.rate_limit import get_rate_limiter
+from pipeline.utils.scrape import get_session
 
 logger = get_logger()
 
@@ -22,16 +23,9 @@ class CompetitionScraper:
         """
         self.base_url = base_url
         self.pipeline_name = pipeline_name
-        self.cache_manager = CacheManager(pipeline_name)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-        })
+        self.cache_manager = get_cache_manager(pipeline_name)
+        self.rate_limiter = get_rate_limiter()
+        self.session = get_session()
     
     def get_page(self, url: str, use_cache: bool = True) -> Optional[BeautifulSoup]:
         """
@@ -50,22 +44,23 @@ class CompetitionScraper:
                 cached_html = self.cache_manager.get_cached_html(url)
                 if cached_html:
                     logger.info(f"[CACHED] {url}")
-                    soup = BeautifulSoup(cached_html, 'html.parser')
+                    soup = BeautifulSoup(cached_html, 'lxml')
                     return soup
             
             # Fetch fresh HTML if not cached or cache disabled
             logger.info(f"Fetching fresh HTML: {url}")
+            self.rate_limiter.wait()  # Be respectful to the server
             response = self.session.get(url, timeout=30)
+            self.rate_limiter.record_response(response.status_code)
             response.raise_for_status()
             
             html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
             
             # Cache the HTML if cache is enabled
             if use_cache:
                 self.cache_manager.cache_html(url, html_content)
             
-            time.sleep(1)  # Be respectful to the server
             return soup
             
         except requests.RequestException as e:
@@ -9,6 +9,7 @@ sys.path.insert(0, str(project_root))
 from pipeline.utils.database import DatabaseManager
 from pipeline.utils.logging import get_logger
 from pipeline.utils.scrape import UniversalScraper
+from pipeline.utils.store import BatchedStore
 from pipeline.fixture.parse import FixtureParser
 
 
@@ -84,7 +85,6 @@ class FixturePipeline:
                 start_year = int(season)
             
             # Calculate the cutoff year
-            from datetime import datetime
             current_year = 2026 #datetime.now().year
             cutoff_year = current_year - years_back #2016
             
@@ -198,14 +198,17 @@ class FixturePipeline:
             logger.error(f"Failed to get competitions with seasons: {e}")
             return []
     
-    def scrape_fixture_for_competition(self, competition: Dict[str, Any], refresh_current_season: bool = False, years_back: int = 10) -> bool:
+    def scrape_fixture_for_competition(self, competition: Dict[str, Any], refresh_current_season: bool = False, years_back: int = 10) -> Optional[Dict[str, List[Dict[str, Any]]]]:
         """
-        Scrape fixture for all seasons of a single competition.
+        Scrape fixture for all seasons of a single competition without storing them.
         
         Args:
             competition: Competition data dictionary
             refresh_current_season: Whether to force refresh the current ongoing season
             years_back: Number of recent years to include (e.g., 10 means from 2015-16 onwards)
+            
+        Returns:
+            Fixtures keyed by season if successful, None otherwise
         """
         competition_name = competition.get('competition_name', 'Unknown')
         competition_id = competition.get('competition_id')
@@ -214,91 +217,88 @@ class FixturePipeline:
         
         if not seasons:
             logger.warning(f"No seasons found for {competition_name}")
-            return False
+            return None
         
         try:
             fixtures_by_season = {}
             total_teams = 0
             
-            # Scrape each season page individually
-            for season_data in seasons:
-                season = season_data.get('season')
-                season_link = season_data.get('season_link')
+            # Scrape each season page individually; fetched pages are cached in one transaction at the end
+            with self.scraper.batched_cache_writes():
+                for season_data in seasons:
+                    season = season_data.get('season')
+                    season_link = season_data.get('season_link')
 
-                # Filter by years_back parameter
-                if not self._is_season_within_years_back(season, years_back):
-                    logger.debug(f"Skipping season {season} (outside {years_back} years back)")
-                    continue
+                    # Filter by years_back parameter
+                    if not self._is_season_within_years_back(season, years_back):
+                        logger.debug("Skipping season %s (outside %s years back)", season, years_back)
+                        continue
 
-                # Initialize use_cache for this iteration
-                use_cache = True  # Default to using cache for efficiency
-                
-                if not season_link:
-                    logger.warning(f"No season link for {competition_name} {season}")
-                    continue
+                    # Initialize use_cache for this iteration
+                    use_cache = True  # Default to using cache for efficiency
+
+                    if not season_link:
+                        logger.warning(f"No season link for {competition_name} {season}")
+                        continue
 
-                # Convert season stats link to fixture link
-                fixture_link = self.convert_season_link_to_fixture_link(season_link)
+                    # Convert season stats link to fixture link
+                    fixture_link = self.convert_season_link_to_fixture_link(season_link)
 
-                # Handle current ongoing season based on refresh parameter
-                if self._is_current_season(season):
-                    # Skip current ongoing season for national tournaments
-                    if competition_type == 'national':
-                        logger.info(f"⏭️  Skipping current or upcoming season for national tournament: {season} {competition_name}")
+                    # Handle current ongoing season based on refresh parameter
+                    if self._is_current_season(season):
+                        # Skip current ongoing season for national tournaments
+                        if competition_type == 'national':
+                            logger.info(f"⏭️  Skipping current or upcoming season for national tournament: {season} {competition_name}")
+                            continue
+
+                        if refresh_current_season:
+                            logger.info(f"🔄 Parsing current season from cache: {season}")
+                            # Skip HTML scraping but still parse cached data
+                            use_cache = False
+                        else:
+                            use_cache = True
+                            logger.info(f"⏭️  Skipping refresh the current season: {season} {competition_name} (use --refresh-current to include)")
+                            #continue
+
+                    # Scrape HTML content for this season's fixtures
+                    # For current season with refresh_current=True, refresh the cached data
+                    # For other seasons, always use cache for efficiency
+                    soup = self.scraper.scrape_season_page(
+                        fixture_link, season, competition_name, competition_id, use_cache=use_cache
+                    )
+
+                    if not soup:
+                        logger.warning(f"✗ {season}: Failed to scrape page")
                         continue
 
-                    if refresh_current_season:
-                        logger.info(f"🔄 Parsing current season from cache: {season}")
-                        # Skip HTML scraping but still parse cached data
-                        use_cache = False
+                    if competition_type == 'domestic':
+                        # Parse regular fixture table
+                        fixture_data = self.parser.parse_fixture(
+                            soup, season, competition_name, competition_id, future_games=False
+                        )
                     else:
-                        use_cache = True
-                        logger.info(f"⏭️  Skipping refresh the current season: {season} {competition_name} (use --refresh-current to include)")
-                        #continue
-                
-                # Scrape HTML content for this season's fixtures
-                # For current season with refresh_current=True, refresh the cached data
-                # For other seasons, always use cache for efficiency
-                soup = self.scraper.scrape_season_page(
-                    fixture_link, season, competition_name, competition_id, use_cache=use_cache
-                )
-                
-                if not soup:
-                    logger.warning(f"✗ {season}: Failed to scrape page")
-                    continue
-                
-                if competition_type == 'domestic':
-                    # Parse regular fixture table
-                    fixture_data = self.parser.parse_fixture(
-                        soup, season, competition_name, competition_id, future_games=False
-                    )
-                else:
-                    # Parse tournament fixture table
-                    fixture_data = self.parser.parse_tournament_fixture(
-                        soup, season, competition_name, competition_id, future_games=False
-                    )
-                
-                if fixture_data:
-                    fixtures_by_season[season] = fixture_data
-                    total_teams += len(fixture_data)
-                    logger.info(f"✓ {season}: {len(fixture_data)} teams scraped")
-                else:
-                    logger.warning(f"✗ {season}: No data scraped")
+                        # Parse tournament fixture table
+                        fixture_data = self.parser.parse_tournament_fixture(
+                            soup, season, competition_name, competition_id, future_games=False
+                        )
+
+                    if fixture_data:
+                        fixtures_by_season[season] = fixture_data
+                        total_teams += len(fixture_data)
+                        logger.info(f"✓ {season}: {len(fixture_data)} teams scraped")
+                    else:
+                        logger.warning(f"✗ {season}: No data scraped")
             
             if not fixtures_by_season:
                 logger.warning(f"No fixture data found for {competition_name}")
-                return False
-            
-            # Store in database
-            with self.db_manager:
-                self.db_manager.insert_fixtures(competition_name, competition_id, fixtures_by_season)
+                return None
             
             logger.info(f"✅ {competition_name}: {total_teams} total team records across {len(fixtures_by_season)} seasons")
-            return True
+            return fixtures_by_season
             
         except Exception as e:
-            logger.error(f"Failed to scrape score tables for {competition_name}: {e}")
-            return False
+            logger.error(f"Failed to scrape fixtures for {competition_name}: {e}")
+            return None
     
     def _is_current_season(self, season: str) -> bool:
         """
@@ -363,18 +363,25 @@ class FixturePipeline:
             # Scrape fixtures for each competition
             successful_scrapes = 0
             failed_scrapes = 0
+            # Scraped fixtures, stored in bulk every few competitions over one database connection
+            with self.db_manager, BatchedStore(self.db_manager.insert_fixtures_bulk, self.db_manager.insert_fixtures) as store:
+                for i, competition in enumerate(competitions, 1):
+                    competition_name = competition.get('competition_name', 'Unknown')
+                    logger.info(f"⚽ {competition_name}")
+                    
+                    fixtures_by_season = self.scrape_fixture_for_competition(competition, refresh_current_season, years_back)
+                    if fixtures_by_season:
+                        store.add((competition_name, competition.get('competition_id'), fixtures_by_season))
+                        successful_scrapes += 1
+                    else:
+                        failed_scrapes += 1
             
-            for i, competition in enumerate(competitions, 1):
-                competition_name = competition.get('competition_name', 'Unknown')
-                logger.info(f"⚽ {competition_name}")
-                
-                if self.scrape_fixture_for_competition(competition, refresh_current_season, years_back):
-                    successful_scrapes += 1
-                else:
-                    failed_scrapes += 1
+            # Competitions that were scraped but could not be stored count as failed
+            successful_scrapes -= store.failed
+            failed_scrapes += store.failed
             
             # Simple summary
-            logger.info(f"✅ Score Table Scraping Completed: {successful_scrapes} successful, {failed_scrapes} failed")
+            logger.info(f"✅ Fixture Scraping Completed: {successful_scrapes} successful, {failed_scrapes} failed")
             
         except Exception as e:
             logger.error(f"Pipeline failed: {e}")
@@ -85,16 +85,16 @@ class FixtureParser:
                 logger.warning(f"No tournament tables found for {competition_name} {season}")
                 return None
             
-            logger.debug(f"Found {len(tournament_tables)} tournament tables")
+            logger.debug("Found %s tournament tables", len(tournament_tables))
             
             for table in tournament_tables:
                 table_id = table.get('id', 'no-id')
-                logger.debug(f"Processing tournament table: {table_id}")
+                logger.debug("Processing tournament table: %s", table_id)
                 
                 # Get column headers and create column mapping
                 column_mapping = self._get_column_mapping(table)
                 if not column_mapping:
-                    logger.debug(f"Skipping table {table_id} - no valid column mapping")
+                    logger.debug("Skipping table %s - no valid column mapping", table_id)
                     continue
                 
                 # Parse all fixture rows from this table
@@ -125,7 +125,7 @@ class FixtureParser:
                             seen_fixtures.add(fixture_key)
                             all_fixtures.append(fixture_data)
                         else:
-                            logger.debug(f"Skipping duplicate fixture: {fixture_key}")
+                            logger.debug("Skipping duplicate fixture: %s", fixture_key)
             
             if all_fixtures:
                 logger.info(f"✓ Parsed {len(all_fixtures)} unique tournament fixtures for {season} {competition_name}")
@@ -158,7 +158,7 @@ class FixtureParser:
         for table_id in table_ids:
             table = soup.find('table', {'id': table_id})
             if table:
-                logger.debug(f"Found league fixtures table by ID: {table_id}")
+                logger.debug("Found league fixtures table by ID: %s", table_id)
                 return table
         
         return None
@@ -176,7 +176,7 @@ class FixtureParser:
             table_id = f'sched_{season}_{competition_id}_{s}'
             t = soup.find('table', {'id': table_id})
             if t:
-                logger.debug(f"Found tournament table by ID: {table_id}")
+                logger.debug("Found tournament table by ID: %s", table_id)
                 tables.append(t)
         if tables:
             return tables
@@ -251,7 +251,7 @@ class FixtureParser:
             if 'week' not in column_mapping:
                 logger.debug("No week column found - this is common for tournament knockout rounds")
             
-            logger.debug(f"Column mapping: {column_mapping}")
+            logger.debug("Column mapping: %s", column_mapping)
             return column_mapping
             
         except Exception as e:
@@ -1,3 +1,4 @@
+import json
 import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional
@@ -47,7 +48,6 @@ class MatchPipeline:
                 start_year = int(season)
             
             # Calculate the cutoff year
-            from datetime import datetime
             current_year = 2026 #datetime.now().year
             cutoff_year = current_year - years_back #2016
             
@@ -69,14 +69,9 @@ class MatchPipeline:
         Returns:
             List of match dictionaries with metadata and match report links ready for scraping
         """
-        if not self.db_manager.conn:
-            self.db_manager.connect()
-        
         try:
-            import json
-            
-            # Get all fixture data
-            fixture_data = self.db_manager.get_fixtures()
+            # Get fixture data, only for the requested competition when one is given
+            fixture_data = self.db_manager.get_fixtures(competition_id or None)
             processed_matches = []
             
             for competition_row in fixture_data:
@@ -94,7 +89,7 @@ class MatchPipeline:
                     
                     # Filter by years_back parameter
                     if not self._is_season_within_years_back(season, years_back):
-                        logger.debug(f"Skipping season {season} (outside {years_back} years back)")
+                        logger.debug("Skipping season %s (outside %s years back)", season, years_back)
                         continue
                     
                     round_name = fixture_json['round']
@@ -113,7 +108,7 @@ class MatchPipeline:
                         match_report_link = game_data.get('match_report_link')
                         
                         if not match_report_link:
-                            logger.debug(f"No match report link for {game_key} in {competition_name} {season}")
+                            logger.debug("No match report link for %s in %s %s", game_key, competition_name, season)
                             continue
                         
                         # Create processed match record
@@ -148,13 +143,37 @@ class MatchPipeline:
             logger.error(f"Failed to process fixture data: {e}")
             return []
 
-    def scrape_match_for_competition(self, competition_id: Optional[int] = None, years_back: int = 10) -> bool:
+    def _store_matches(self, matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Store parsed matches in one transaction, falling back to one insert per match if the batch fails.
+        
+        Args:
+            matches: Complete match dictionaries to store
+            
+        Returns:
+            Matches that could not be stored
+        """
+        try:
+            self.db_manager.insert_matches(matches)
+            return []
+        except Exception:
+            # Isolate the bad rows so the rest of the batch is still stored
+            failed = []
+            for match in matches:
+                try:
+                    self.db_manager.insert_match(match)
+                except Exception:
+                    failed.append(match)
+            return failed
+    
+    def scrape_match_for_competition(self, competition_id: Optional[int] = None, years_back: int = 10, batch_size: int = 50) -> bool:
         """
         Scrape match reports for a specific competition.
         
         Args:
             competition_id: Competition ID to scrape matches for
             years_back: Number of recent years to include (e.g., 10 means from 2015-16 onwards)
+            batch_size: Number of parsed matches stored per database transaction
             
         Returns:
             True if successful, False otherwise
@@ -171,42 +190,61 @@ class MatchPipeline:
             
             successful_scrapes = 0
             failed_scrapes = 0
+            # Parsed matches waiting to be stored
+            pending_matches = []
             
-            for i, match in enumerate(match_data, 1):
-                logger.info(f"Processing match {i}/{len(match_data)}: {match['home_team']} vs {match['away_team']}")
-                
-                try:
-                    # Scrape the match report page
-                    soup = self.scraper.get_page(match['match_link'])
-                    
-                    if not soup:
-                        logger.warning(f"Failed to scrape match report: {match['match_link']}")
+            # Stores the pending batch; matches are counted and logged as processed only once stored
+            def store_pending():
+                nonlocal successful_scrapes, failed_scrapes, pending_matches
+                matches, pending_matches = pending_matches, []
+                failed_ids = {id(failed_match) for failed_match in self._store_matches(matches)}
+                for stored_match in matches:
+                    if id(stored_match) in failed_ids:
+                        logger.warning(f"✗ Failed to store match: {stored_match['home_team']} vs {stored_match['away_team']}")
                         failed_scrapes += 1
-                        continue
-                    
-                    # Parse the match data
-                    parsed_data = self.parser.parse_match_data(soup, match['match_link'])
+                    else:
+                        logger.info(f"✓ Successfully processed match: {stored_match['home_team']} vs {stored_match['away_team']}")
+                        successful_scrapes += 1
+            
+            try:
+                for i, match in enumerate(match_data, 1):
+                    logger.info(f"Processing match {i}/{len(match_data)}: {match['home_team']} vs {match['away_team']}")
                     
-                    if parsed_data:
-                        # Combine fixture data with parsed match data
-                        complete_match = {**match, **parsed_data}
+                    try:
+                        # Scrape the match report page
+                        soup = self.scraper.get_page(match['match_link'])
+                        
+                        if not soup:
+                            logger.warning(f"Failed to scrape match report: {match['match_link']}")
+                            failed_scrapes += 1
+                            continue
                         
-                        # Store in database
-                        self.db_manager.insert_match(complete_match)
+                        # Parse the match data
+                        parsed_data = self.parser.parse_match_data(soup, match['match_link'])
                         
-                        successful_scrapes += 1
-                        logger.info(f"✓ Successfully processed match: {match['home_team']} vs {match['away_team']}")
-                    else:
-                        logger.warning(f"✗ Failed to parse match data: {match['home_team']} vs {match['away_team']}")
+                        if parsed_data:
+                            # Combine fixture data with parsed match data
+                            complete_match = {**match, **parsed_data}
+                            
+                            # Store in database, one transaction per batch
+                            pending_matches.append(complete_match)
+                            if len(pending_matches) >= batch_size:
+                                store_pending()
+                        else:
+                            logger.warning(f"✗ Failed to parse match data: {match['home_team']} vs {match['away_team']}")
+                            failed_scrapes += 1
+                            
+                    except PipelineStopError as e:
+                        logger.error(f"Pipeline stopping error processing match {match['home_team']} vs {match['away_team']}: {e}")
+                         # Re-raise to stop the entire pipeline
+                    except Exception as e:
+                        logger.error(f"Error processing match {match['home_team']} vs {match['away_team']}: {e}")
                         failed_scrapes += 1
-                        
-                except PipelineStopError as e:
-                    logger.error(f"Pipeline stopping error processing match {match['home_team']} vs {match['away_team']}: {e}")
-                     # Re-raise to stop the entire pipeline
-                except Exception as e:
-                    logger.error(f"Error processing match {match['home_team']} vs {match['away_team']}: {e}")
-                    failed_scrapes += 1
-                    continue
+                        continue
+            finally:
+                # Store the last batch, also when the loop is interrupted
+                if pending_matches:
+                    store_pending()
             
             logger.info(f"Match scraping completed: {successful_scrapes} successful, {failed_scrapes} failed")
             
@@ -234,12 +272,12 @@ class MatchPipeline:
             # Get competitions to process from all competition tables
             competitions = []
             
-            # Get club competitions
-            club_competitions = self.db_manager.get_competitions('competition_club')
+            # Get club competitions (name and ID are all this loop needs)
+            club_competitions = self.db_manager.get_competition_summaries('competition_club')
             competitions.extend(club_competitions)
             
             # Get nation competitions  
-            nation_competitions = self.db_manager.get_competitions('competition_nation')
+            nation_competitions = self.db_manager.get_competition_summaries('competition_nation')
             competitions.extend(nation_competitions)
             
             if competition_id:
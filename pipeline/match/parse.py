@@ -8,12 +8,90 @@ This module parses HTML content from FBref match report pages to extract:
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+import sys
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
 from bs4 import BeautifulSoup
 import re
-from pipeline.utils.mapping import COUNTRY_MAPPING, STATS_MAPPING
+import soupsieve
+
+from pipeline.utils.mapping import COUNTRY_MAPPING, STATS_MAPPING, TEAM_STATS_MAPPING
 logger = logging.getLogger(__name__)
 
+# Pre-compiled patterns used on every match page
+_MATCH_ID_RE = re.compile(r'/matches/([^/]+)/')
+_FORMATION_RE = re.compile(r'\s*\([^)]*\)$')
+_PLAYER_ID_RE = re.compile(r'/players/([^/]+)/')
+_MINUTE_RE = re.compile(r'(\d+(?:\+\d*)?[\']?)')
+_ASSIST_RE = re.compile(r'Assist:\s*(.+)')
+_COUNTRY_CODE_RE = re.compile(r'([A-Z]{3})')
+_PERCENT_RE = re.compile(r'(\d+(?:\.\d+)?)%')
+
+# Precompiled selectors for walking the team_stats table
+_ROW_SEL = soupsieve.compile('tr')
+_CELL_SEL = soupsieve.compile(':scope > td, :scope > th')
+
+# Team stat names mapped to database field names, interned so the same
+# key objects are reused for every team_stats dict built from a match page
+_STAT_NAME_MAP = {sys.intern(k): sys.intern(v) for k, v in TEAM_STATS_MAPPING.items()}
+
+
+def _coerce_number(text: str) -> Any:
+    """Convert a numeric cell ('12', '-1.5', '45.2%') to int/float, returning other text untouched."""
+    is_percent = '%' in text
+    number = text.replace('%', '') if is_percent else text
+    unsigned = number[1:] if number[:1] == '-' else number
+    if not unsigned.replace('.', '', 1).isdecimal():
+        return text
+    return float(number) if is_percent or '.' in number else int(number)
+
+
+def _parse_percent(text: str) -> Optional[float]:
+    """Extract the number before '%', skipping the regex for plain values like "76%"."""
+    number = text[:-1] if text.endswith('%') else ''
+    if number[:1].isdigit() and number[-1:].isdigit() and number.replace('.', '', 1).isdigit():
+        return float(number)
+    percent_match = _PERCENT_RE.search(text)
+    return float(percent_match.group(1)) if percent_match else None
+
+
+def _parse_percent_stat(value_str: str) -> Optional[float]:
+    """Parse a percentage stat such as "76%" or "290 of 381 —76%"."""
+    if '—' in value_str:
+        # Split by em dash and look for percentage
+        for part in value_str.split('—'):
+            part = part.strip()
+            if '%' in part:
+                percent = _parse_percent(part)
+                if percent is not None:
+                    return percent
+        return None
+    if '%' in value_str:
+        # Direct percentage extraction
+        return _parse_percent(value_str)
+    return None
+
+
+def _parse_number_stat(value_str: str) -> Any:
+    """Parse a count stat as int, then float, returning the original text if neither fits."""
+    try:
+        # Plain numbers are the common case, try int first, then float
+        if '%' not in value_str:
+            try:
+                return int(value_str)
+            except ValueError:
+                return float(value_str)
+        return float(value_str.replace('%', ''))
+    except (ValueError, TypeError):
+        return value_str
+
+
+# Value parser for every mapped team stat, resolved once instead of per cell
+_STAT_PARSERS = {
+    name: _parse_percent_stat if name.endswith('%') else _parse_number_stat
+    for name in _STAT_NAME_MAP.values()
+}
+
 
 class PipelineStopError(Exception):
     """Exception that should stop the entire pipeline execution."""
@@ -26,7 +104,7 @@ class MatchParser:
         """Extract match ID from the match URL."""
         try:
             # Extract ID from URL like: https://fbref.com/en/matches/cc5b4244/Manchester-United-Fulham-August-16-2024-Premier-League
-            match = re.search(r'/matches/([^/]+)/', match_url)
+            match = _MATCH_ID_RE.search(match_url)
             return match.group(1) if match else ""
         except Exception as e:
             logger.error(f"Error extracting match ID from {match_url}: {e}")
@@ -110,8 +188,8 @@ class MatchParser:
                 if header_th:
                     header_text = header_th.get_text(strip=True)
                     # Extract team name (everything before the formation in parentheses)
-                    team_name = re.sub(r'\s*\([^)]*\)$', '', header_text).strip()
-                    logger.debug(f"Found team: {team_name}")
+                    team_name = _FORMATION_RE.sub('', header_text).strip()
+                    logger.debug("Found team: %s", team_name)
                 
                 # Process table rows
                 rows = table.find_all('tr')
@@ -137,7 +215,7 @@ class MatchParser:
                             # Extract player ID from URL
                             player_id = ""
                             if player_url:
-                                player_id_match = re.search(r'/players/([^/]+)/', player_url)
+                                player_id_match = _PLAYER_ID_RE.search(player_url)
                                 if player_id_match:
                                     player_id = player_id_match.group(1)
                             
@@ -149,7 +227,7 @@ class MatchParser:
                             
                             lineup_data[current_section][team_key].append(player_data)
             
-            logger.debug(f"Parsed lineup: {len(lineup_data['start']['home_team'])} home starters, {len(lineup_data['start']['away_team'])} away starters")
+            logger.debug("Parsed lineup: %s home starters, %s away starters", len(lineup_data['start']['home_team']), len(lineup_data['start']['away_team']))
             return lineup_data
             
         except Exception as e:
@@ -189,7 +267,7 @@ class MatchParser:
                 if first_div:
                     minute_text = first_div.get_text(strip=True)
                     # Extract minute (handles 90+1, 87', etc.)
-                    minute_match = re.search(r'(\d+(?:\+\d*)?[\']?)', minute_text)
+                    minute_match = _MINUTE_RE.search(minute_text)
                     if minute_match:
                         minute = minute_match.group(1)
                     
@@ -238,7 +316,7 @@ class MatchParser:
                             assist_text = small.get_text(strip=True)
                             if 'Assist:' in assist_text:
                                 # Extract assist player name
-                                assist_match = re.search(r'Assist:\s*(.+)', assist_text)
+                                assist_match = _ASSIST_RE.search(assist_text)
                                 if assist_match:
                                     assist_player = assist_match.group(1).strip()
                                 break
@@ -266,7 +344,7 @@ class MatchParser:
                 events[f'event_{event_counter}'] = event_data
                 event_counter += 1
             
-            logger.debug(f"Parsed {len(events)} match events")
+            logger.debug("Parsed %s match events", len(events))
             return events
             
         except Exception as e:
@@ -306,7 +384,7 @@ class MatchParser:
                 logger.debug("Found team_stats_extra div")
                 self.process_team_stats_extra(team_stats_extra_div, team_stats)
             
-            logger.debug(f"Parsed team stats: {len(team_stats['home_team'])} stats for each team")
+            logger.debug("Parsed team stats: %s stats for each team", len(team_stats['home_team']))
             return team_stats
             
         except Exception as e:
@@ -439,7 +517,8 @@ class MatchParser:
             for cell in header_cells:
                 data_stat = cell.get('data-stat')
                 if data_stat:
-                    headers.append(data_stat)
+                    # Interned so every player dict shares the same key objects
+                    headers.append(sys.intern(data_stat))
         
         # Process each player row
         tbody = stats_table.find('tbody')
@@ -539,7 +618,8 @@ class MatchParser:
             for cell in header_cells:
                 data_stat = cell.get('data-stat')
                 if data_stat:
-                    headers.append(data_stat)
+                    # Interned so every player dict shares the same key objects
+                    headers.append(sys.intern(data_stat))
         
         # Process each goalkeeper row
         tbody = stats_table.find('tbody')
@@ -587,7 +667,7 @@ class MatchParser:
                                     # Extract the country code from the span text
                                     span_text = country_span.get_text(strip=True)
                                     # Look for 3-letter country code pattern
-                                    country_match = re.search(r'([A-Z]{3})', span_text)
+                                    country_match = _COUNTRY_CODE_RE.search(span_text)
                                     if country_match:
                                         country = country_match.group(1)
                                         if country in COUNTRY_MAPPING:
@@ -614,14 +694,8 @@ class MatchParser:
                                        'gk_goal_kicks', 'gk_pct_goal_kicks_launched', 'gk_goal_kick_length_avg',
                                        'gk_crosses', 'gk_crosses_stopped', 'gk_crosses_stopped_pct',
                                        'gk_def_actions_outside_pen_area', 'gk_avg_distance_def_actions']:
-                            try:
-                                # Handle percentage values
-                                if '%' in stat_value:
-                                    stat_value = float(stat_value.replace('%', ''))
-                                else:
-                                    stat_value = float(stat_value) if '.' in stat_value else int(stat_value)
-                            except (ValueError, TypeError):
-                                pass  # Keep as string if conversion fails
+                            # Keeps the string if it is not numeric
+                            stat_value = _coerce_number(stat_value)
                         
                         goalkeeper_data[field_name] = stat_value
                 
@@ -633,24 +707,54 @@ class MatchParser:
 
     def process_team_stats_table(self, stats_table: BeautifulSoup, team_stats: Dict[str, Any]) -> None:
         """Process a stats table and add results to team_stats dictionary."""
-        rows = stats_table.find_all('tr')
+        self._ingest_stat_triples(self._team_stats_table_triples(stats_table), team_stats)
+    
+    def process_team_stats_extra(self, team_stats_extra_div: BeautifulSoup, team_stats: Dict[str, Any]) -> None:
+        """Process the team_stats_extra div which contains additional statistics in div format."""
+        self._ingest_stat_triples(self._team_stats_extra_triples(team_stats_extra_div), team_stats)
+    
+    def _ingest_stat_triples(self, triples: Iterable[Tuple[str, str, str]], team_stats: Dict[str, Any]) -> None:
+        """
+        Map and parse (stat_name, home_value, away_value) triples into team_stats.
+        
+        Args:
+            triples: Raw stat name and home/away value strings
+            team_stats: Dictionary with 'home_team' and 'away_team' sub-dicts to update
+        """
+        home_stats = {}
+        away_stats = {}
+        
+        for stat_name, home_value, away_value in triples:
+            mapped_name = self.map_stat_name(stat_name)
+            if mapped_name:
+                parser = _STAT_PARSERS[mapped_name]
+                home_stats[mapped_name] = parser(home_value)
+                away_stats[mapped_name] = parser(away_value)
+        
+        team_stats['home_team'].update(home_stats)
+        team_stats['away_team'].update(away_stats)
+    
+    def _team_stats_table_triples(self, stats_table: BeautifulSoup) -> Iterator[Tuple[str, str, str]]:
+        """Yield (stat_name, home_value, away_value) triples from the team_stats table."""
+        rows = _ROW_SEL.select(stats_table)
         current_stat_name = None
         
         for i, row in enumerate(rows):
-            cells = row.find_all(['td', 'th'])
+            cells = _CELL_SEL.select(row)
+            first = cells[0]
             
             # Handle stat name rows (th with colspan=2)
-            if cells[0].name == 'th' and cells[0].get('colspan') == '2':
-                current_stat_name = cells[0].get_text(strip=True).lower()
+            if first.name == 'th' and first.attrs.get('colspan') == '2':
+                current_stat_name = first.get_text(strip=True).lower()
                 continue
             
-            # Extract content from cells
-            cell_texts = [cell.get_text(strip=True) for cell in cells]
-            
             # Skip team name row (first row)
             if i == 0:
                 continue
             
+            # Extract content from cells
+            cell_texts = [cell.get_text(strip=True) for cell in cells]
+            
             # Check if this is a stat name row (has only one cell with stat name)
             if len(cell_texts) == 1 and cell_texts[0] and len(cell_texts[0]) < 30:
                 current_stat_name = cell_texts[0].lower()
@@ -658,19 +762,11 @@ class MatchParser:
             
             # Check if this is a values row (has two cells with values)
             if len(cell_texts) == 2 and current_stat_name and cell_texts[0] and cell_texts[1]:
-                # Map stat names to expected format first
-                mapped_name = self.map_stat_name(current_stat_name)
-                if mapped_name:
-                    home_value = self.parse_stat_value(cell_texts[0], mapped_name)
-                    away_value = self.parse_stat_value(cell_texts[1], mapped_name)
-                    
-                    team_stats['home_team'][mapped_name] = home_value
-                    team_stats['away_team'][mapped_name] = away_value
-                
+                yield current_stat_name, cell_texts[0], cell_texts[1]
                 current_stat_name = None  # Reset for next stat
     
-    def process_team_stats_extra(self, team_stats_extra_div: BeautifulSoup, team_stats: Dict[str, Any]) -> None:
-        """Process the team_stats_extra div which contains additional statistics in div format."""
+    def _team_stats_extra_triples(self, team_stats_extra_div: BeautifulSoup) -> Iterator[Tuple[str, str, str]]:
+        """Yield (stat_name, home_value, away_value) triples from the team_stats_extra div."""
         # Find all stat groups (each group is in its own div)
         stat_groups = team_stats_extra_div.find_all('div')
         
@@ -685,12 +781,9 @@ class MatchParser:
             if len(stat_divs) < 3:  # Need at least home value, stat name, away value
                 continue
             
-            # Extract stat data
+            # Extract stat data, skipping empty entries
             # The structure is: [home_value, stat_name, away_value, ...]
-            stat_data = [div.get_text(strip=True) for div in stat_divs]
-            
-            # Skip empty stat names
-            stat_data = [data for data in stat_data if data.strip()]
+            stat_data = [text for text in (div.get_text(strip=True) for div in stat_divs) if text]
             
             # Process stats in groups of 3: home_value, stat_name, away_value
             # Skip the first 2 elements if they contain team names
@@ -698,87 +791,26 @@ class MatchParser:
             if len(stat_data) >= 2:# and ('Manchester Utd' in stat_data[:2] or 'Fulham' in stat_data[:2]):
                 start_index = 2
             
-            for i in range(start_index, len(stat_data) - 2, 3):
-                if i + 2 < len(stat_data):
-                    home_value = stat_data[i]
-                    stat_name = stat_data[i + 1]
-                    away_value = stat_data[i + 2]
-                    
-                    # Skip if any of these are empty or look like team names
-                    if not home_value or not stat_name or not away_value:
-                        continue
-                    if len(stat_name) > 20:  # Skip if it looks like a team name
-                        continue
-                    
-                    # Skip if stat_name is a number (wrong parsing)
-                    if stat_name.isdigit():
-                        continue
-                    
-                    # Map stat name first
-                    mapped_name = self.map_stat_name(stat_name.lower())
-                    if mapped_name:
-                        # Parse values with stat name context
-                        home_parsed = self.parse_stat_value(home_value, mapped_name)
-                        away_parsed = self.parse_stat_value(away_value, mapped_name)
-                        
-                        team_stats['home_team'][mapped_name] = home_parsed
-                        team_stats['away_team'][mapped_name] = away_parsed
+            for home_value, stat_name, away_value in zip(stat_data[start_index::3], stat_data[start_index + 1::3], stat_data[start_index + 2::3]):
+                # Skip if stat_name looks like a team name or is a number (wrong parsing);
+                # empty entries were already dropped from stat_data
+                if len(stat_name) > 20 or stat_name.isdigit():
+                    continue
+                
+                yield stat_name, home_value, away_value
     
     def parse_stat_value(self, value_str: str, stat_name: str = None) -> Any:
         """Parse a statistic value, handling percentages and numbers."""
+        parser = _STAT_PARSERS.get(stat_name)
+        if parser is None:
+            parser = _parse_percent_stat if stat_name and stat_name.endswith('%') else _parse_number_stat
         try:
-            # For specific percentage fields, extract only the percentage part
-            if stat_name and stat_name.endswith('%'):
-                # Extract percentage from strings like "290 of 381 —76%" or "76%— 290 of 381"
-                if '—' in value_str:
-                    # Split by em dash and look for percentage
-                    parts = value_str.split('—')
-                    for part in parts:
-                        part = part.strip()
-                        if '%' in part:
-                            # Extract just the number before %
-                            percent_match = re.search(r'(\d+(?:\.\d+)?)%', part)
-                            if percent_match:
-                                return float(percent_match.group(1))
-                elif '%' in value_str:
-                    # Direct percentage extraction
-                    percent_match = re.search(r'(\d+(?:\.\d+)?)%', value_str)
-                    if percent_match:
-                        return float(percent_match.group(1))
-                return None
-            
-            # For other fields, use original logic
-            if '%' in value_str:
-                return float(value_str.replace('%', ''))
-            
-            # Try to convert to int first, then float
-            try:
-                return int(value_str)
-            except ValueError:
-                return float(value_str)
+            return parser(value_str)
         except (ValueError, TypeError):
             return value_str
     
-    def map_stat_name(self, stat_name: str) -> Optional[str]:
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def map_stat_name(stat_name: str) -> Optional[str]:
         """Map HTML stat names to expected database field names."""
-        mapping = {
-            'possession': 'possession%',
-            'passing accuracy': 'passing_accuracy%',
-            'shots on target': 'shots_on_target%',
-            'saves': 'saves%',
-            'cards': 'cards',
-            'fouls': 'fouls',
-            'corners': 'corners',
-            'crosses': 'crosses',
-            'touches': 'touches',
-            'tackles': 'tackles',
-            'interceptions': 'interceptions',
-            'aerials won': 'aerials_won',
-            'clearances': 'clearances',
-            'offsides': 'offsides',
-            'goal kicks': 'goal_kicks',
-            'throw ins': 'throw_ins',
-            'long balls': 'long_balls'
-        }
-        
-        return mapping.get(stat_name.lower())
+        return _STAT_NAME_MAP.get(stat_name.lower())
@@ -1,6 +1,8 @@
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent.parent
@@ -8,6 +10,8 @@ sys.path.insert(0, str(project_root))
 
 from pipeline.utils.database import DatabaseManager
 from pipeline.utils.logging import get_logger
+from pipeline.utils.scrape import get_session
+from pipeline.utils.store import BatchedStore
 from pipeline.season.parse_season import SeasonParser
 from pipeline.season.parse_club_tournament import SeasonClubTournamentParser
 from pipeline.season.parse_nation_tournament import SeasonNationTournamentParser
@@ -25,9 +29,13 @@ class SeasonPipeline:
             db_path: Path to the DuckDB database file
         """
         self.db_manager = DatabaseManager(db_path)
-        self.season_parser = SeasonParser()
-        self.club_tournament_parser = SeasonClubTournamentParser()
-        self.nation_tournament_parser = SeasonNationTournamentParser()
+        # One session for all parsers so concurrent fetches reuse keep-alive connections
+        self.session = get_session()
+        self.season_parser = SeasonParser(session=self.session)
+        self.club_tournament_parser = SeasonClubTournamentParser(session=self.session)
+        self.nation_tournament_parser = SeasonNationTournamentParser(session=self.session)
+        # Serializes database access from concurrent competition scrapes
+        self.db_lock = threading.Lock()
         
     def get_competitions_to_scrape(self, competition_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -62,15 +70,15 @@ class SeasonPipeline:
         
         return competitions
     
-    def scrape_seasons_for_competition(self, competition: Dict[str, Any]) -> bool:
+    def scrape_seasons_for_competition(self, competition: Dict[str, Any]) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
         """
-        Scrape seasons for a single competition and store in the appropriate table.
+        Scrape seasons for a single competition without storing them.
         
         Args:
             competition: Competition dictionary with name, link, and ID
             
         Returns:
-            True if successful, False otherwise
+            Tuple of (table_name, seasons_data) if successful, None otherwise
         """
         competition_name = competition.get('competition_name', 'Unknown')
         competition_link = competition.get('competition_link', '')
@@ -78,11 +86,11 @@ class SeasonPipeline:
         
         if not competition_link or not competition_id:
             logger.error(f"Missing competition_link or competition_id for {competition_name}")
-            return False
+            return None
 
         try:
             # Determine which parser to use based on competition type
-            with self.db_manager:
+            with self.db_lock, self.db_manager:
                 competition_db_type = self.db_manager.get_competition_type(competition_id)
             
             # Choose the appropriate parser
@@ -103,18 +111,18 @@ class SeasonPipeline:
             
             if not seasons_data:
                 logger.warning(f"No seasons data found for {competition_name}")
-                return False
-            
-            # Store in the appropriate table
-            with self.db_manager:
-                self.db_manager.insert_seasons(competition_name, competition_id, seasons_data, table_name)
-                logger.info(f"✓ {competition_name}: Stored in {table_name} table")
+                return None
             
-            return True
+            return table_name, seasons_data
             
         except Exception as e:
             logger.error(f"Failed to scrape seasons for {competition_name}: {e}")
-            return False
+            return None
+
+    def _locked_insert(self, insert, *args):
+        """Run a DatabaseManager insert while holding the lock shared with the scraping threads."""
+        with self.db_lock, self.db_manager:
+            insert(*args)
 
     def _is_current_season(self, season: str) -> bool:
         """
@@ -131,12 +139,16 @@ class SeasonPipeline:
 
         return False
     
-    def scrape_seasons(self, competition_id: Optional[int] = None):
+    def scrape_seasons(self, competition_id: Optional[int] = None, max_workers: int = 8):
         """
         Run the complete season scraping pipeline.
         
+        Competitions are scraped concurrently; requests to FBref are still spaced
+        out by the shared rate limiter used by the season parsers.
+        
         Args:
             competition_id: Specific competition ID to scrape, or None for all
+            max_workers: Number of competitions to scrape concurrently
         """
         logger.info("Starting Season Scraping Pipeline")
         
@@ -158,13 +170,39 @@ class SeasonPipeline:
             successful_scrapes = 0
             failed_scrapes = 0
             
-            for i, competition in enumerate(competitions, 1):
-                competition_name = competition.get('competition_name', 'Unknown')
-                
-                if self.scrape_seasons_for_competition(competition):
-                    successful_scrapes += 1
-                else:
-                    failed_scrapes += 1
+            # Scraped rows per target table, stored in bulk every few competitions
+            stores: Dict[str, BatchedStore] = {}
+            
+            def store_for(table_name: str) -> BatchedStore:
+                if table_name not in stores:
+                    stores[table_name] = BatchedStore(
+                        lambda rows: self._locked_insert(self.db_manager.insert_seasons_bulk, rows, table_name),
+                        lambda name, comp_id, seasons: self._locked_insert(self.db_manager.insert_seasons, name, comp_id, seasons, table_name),
+                    )
+                return stores[table_name]
+            
+            try:
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {executor.submit(self.scrape_seasons_for_competition, competition): competition for competition in competitions}
+                    
+                    for future in as_completed(futures):
+                        result = future.result()
+                        if result:
+                            competition = futures[future]
+                            table_name, seasons_data = result
+                            store_for(table_name).add((competition['competition_name'], competition['competition_id'], seasons_data))
+                            successful_scrapes += 1
+                        else:
+                            failed_scrapes += 1
+            finally:
+                # Store what is left, also when the run is interrupted
+                for store in stores.values():
+                    store.flush()
+            
+            # Competitions that were scraped but could not be stored count as failed
+            failed_inserts = sum(store.failed for store in stores.values())
+            successful_scrapes -= failed_inserts
+            failed_scrapes += failed_inserts
             
             # Simple summary
             logger.info(f"✅ Competition Scraping Completed: {successful_scrapes} successful, {failed_scrapes} failed")
@@ -1,76 +1,99 @@
 import requests
 from bs4 import BeautifulSoup
+import lxml.html
 import re
-import time
 from typing import List, Dict, Any, Optional
 from urllib.parse import urljoin
 from pipeline.utils.logging import get_logger
-from pipeline.utils.cache import CacheManager
+from pipeline.utils.cache import get_cache_manager
+from pipeline.utils.scrape import get_session
+from pipeline.utils.rate_limit import get_rate_limiter
+from pipeline.utils.convert import cell_text, safe_int
 
 logger = get_logger()
 
+_COMP_ID_RE = re.compile(r'/en/comps/(\d+)/')
+
+
+def _extract_table_html(html_content: str, table_id: str) -> Optional[str]:
+    """Slice the markup of a single table out of a page so only that table gets parsed."""
+    marker = html_content.find(f'id="{table_id}"')
+    if marker == -1:
+        return None
+    start = html_content.rfind('<table', 0, marker)
+    end = html_content.find('</table>', marker)
+    if start == -1 or end == -1:
+        return None
+    return html_content[start:end + len('</table>')]
+
+
 class SeasonClubTournamentParser:
     """Base class for scraping FBref season data."""
     
-    def __init__(self, base_url: str = "https://fbref.com", pipeline_name: str = "season"):
+    def __init__(self, base_url: str = "https://fbref.com", pipeline_name: str = "season", session: Optional[requests.Session] = None):
         """
         Initialize the parser.
         
         Args:
             base_url: Base URL for FBref
             pipeline_name: Name of the pipeline for cache management
+            session: Optional HTTP session to share connections with other parsers
         """
         self.base_url = base_url
         self.pipeline_name = pipeline_name
-        self.cache_manager = CacheManager(pipeline_name)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0'
-        })
+        self.cache_manager = get_cache_manager(pipeline_name)
+        self.rate_limiter = get_rate_limiter()
+        self.session = session or get_session()
     
-    def get_page(self, url: str, use_cache: bool = True) -> Optional[BeautifulSoup]:
+    def get_html(self, url: str, use_cache: bool = True) -> Optional[str]:
         """
-        Fetch a page and return BeautifulSoup object.
+        Fetch a page and return its raw HTML.
         
         Args:
             url: URL to fetch
             use_cache: Whether to use cached HTML if available
             
         Returns:
-            BeautifulSoup object or None if failed
+            HTML content or None if failed
         """
         try:
             if use_cache:
                 cached_html = self.cache_manager.get_cached_html(url)
                 if cached_html:
                     logger.info(f"[CACHE] - {url}")
-                    return BeautifulSoup(cached_html, 'html.parser')
+                    return cached_html
             
             logger.info(f"Fetching fresh HTML: {url}")
+            self.rate_limiter.wait()  # Be respectful to the server
             response = self.session.get(url, timeout=30)
+            self.rate_limiter.record_response(response.status_code)
             response.raise_for_status()
             html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
             
             if use_cache:
                 self.cache_manager.cache_html(url, html_content)
-            
-            time.sleep(1)  # Be respectful to the server
-            return soup
+            return html_content
             
         except requests.RequestException as e:
             logger.error(f"Failed to fetch {url}: {e}")
             return None
     
+    def get_page(self, url: str, use_cache: bool = True) -> Optional[BeautifulSoup]:
+        """
+        Fetch a page and return BeautifulSoup object.
+        
+        Args:
+            url: URL to fetch
+            use_cache: Whether to use cached HTML if available
+            
+        Returns:
+            BeautifulSoup object or None if failed
+        """
+        html_content = self.get_html(url, use_cache=use_cache)
+        if not html_content:
+            return None
+        return BeautifulSoup(html_content, 'lxml')
+    
     def extract_competition_id(self, competition_link: str) -> Optional[int]:
         """
         Extract competition ID from competition link.
@@ -83,7 +106,7 @@ class SeasonClubTournamentParser:
         """
         try:
             # Pattern: /en/comps/{id}/...
-            match = re.search(r'/en/comps/(\d+)/', competition_link)
+            match = _COMP_ID_RE.search(competition_link)
             if match:
                 return int(match.group(1))
             return None
@@ -97,7 +120,7 @@ class SeasonClubTournamentParser:
         Expected columns: Season, Competition Name, # Squads, Champion, Runner-Up, Final, Top Scorer
         
         Args:
-            cells: List of table cells
+            cells: List of lxml table cell elements
             competition_name: Name of the competition
             competition_id: ID of the competition
             
@@ -111,35 +134,32 @@ class SeasonClubTournamentParser:
             
             # Extract season
             season_cell = cells[0]
-            season_link = season_cell.find('a')
-            if not season_link:
+            season_link = season_cell.find('.//a')
+            if season_link is None:
                 logger.warning("No season link found")
                 return None
             
-            season = season_link.get_text(strip=True)
+            season = cell_text(season_link)
             season_link_href = season_link.get('href', '')
             
             # Extract number of squads (column 2)
             squads_cell = cells[2]
-            squads_text = squads_cell.get_text(strip=True)
-            try:
-                num_squads = int(squads_text) if squads_text.isdigit() else None
-            except ValueError:
-                num_squads = None
+            squads_text = cell_text(squads_cell)
+            num_squads = safe_int(squads_text)
             
             # Extract champion (column 3)
             champion_cell = cells[3]
-            champion_text = champion_cell.get_text(strip=True)
+            champion_text = cell_text(champion_cell)
             champion = champion_text if champion_text else None
             
             # Extract runner-up (column 4)
             runner_up_cell = cells[4]
-            runner_up_text = runner_up_cell.get_text(strip=True)
+            runner_up_text = cell_text(runner_up_cell)
             runner_up = runner_up_text if runner_up_text else None
             
             # Extract top scorer and goals (column 6)
             top_scorer_cell = cells[6]
-            top_scorer_text = top_scorer_cell.get_text(strip=True)
+            top_scorer_text = cell_text(top_scorer_cell)
             
             # Parse top scorer (can be multiple players)
             top_scorer = None
@@ -147,23 +167,17 @@ class SeasonClubTournamentParser:
             
             if top_scorer_text and top_scorer_text != '':
                 # Handle format like "Kylian Mbappé - 5" or "Raphinha, Serhou Guirassy - 13"
-                if '-' in top_scorer_text and not top_scorer_text.startswith('-'):
-                    # Split on the last dash to separate names from goals
-                    parts = top_scorer_text.rsplit('-', 1)
-                    if len(parts) == 2:
-                        scorer_names = parts[0].strip()
-                        try:
-                            top_goals = int(parts[1].strip())
-                        except ValueError:
-                            top_goals = None
-                        
-                        # Handle multiple scorers
-                        if ',' in scorer_names:
-                            top_scorer = [name.strip() for name in scorer_names.split(',')]
-                        else:
-                            top_scorer = scorer_names
+                # Split on the last dash to separate names from goals
+                scorer_names, sep, goals_text = top_scorer_text.rpartition('-')
+                if sep and not top_scorer_text.startswith('-'):
+                    scorer_names = scorer_names.strip()
+                    top_goals = safe_int(goals_text.strip())
+                    
+                    # Handle multiple scorers
+                    if ',' in scorer_names:
+                        top_scorer = [name.strip() for name in scorer_names.split(',')]
                     else:
-                        top_scorer = top_scorer_text
+                        top_scorer = scorer_names
                 else:
                     # No goals info or starts with dash
                     top_scorer = top_scorer_text
@@ -199,28 +213,34 @@ class SeasonClubTournamentParser:
         # Construct full URL
         full_url = urljoin(self.base_url, competition_link)
         
-        soup = self.get_page(full_url)
-        if not soup:
+        html_content = self.get_html(full_url)
+        if not html_content:
             logger.error(f"Failed to fetch page: {full_url}")
             return []
         
-        # Find the seasons table
-        seasons_table = soup.find('table', {'id': 'seasons'})
-        if not seasons_table:
+        # Find the seasons table, parsing only its markup when it can be located
+        seasons_tables = []
+        seasons_html = _extract_table_html(html_content, 'seasons')
+        if seasons_html:
+            seasons_tables = lxml.html.fromstring(seasons_html).xpath('//table[@id="seasons"]')
+        if not seasons_tables or seasons_tables[0].find('tbody') is None:
+            # The slice did not hold a complete seasons table; parse the whole page instead
+            seasons_tables = lxml.html.fromstring(html_content).xpath('//table[@id="seasons"]')
+        if not seasons_tables:
             logger.warning(f"Seasons table not found for {competition_name}")
             return []
         
         seasons_data = []
-        tbody = seasons_table.find('tbody')
-        if not tbody:
+        tbody = seasons_tables[0].find('tbody')
+        if tbody is None:
             logger.warning(f"Seasons table body not found for {competition_name}")
             return []
         
-        rows = tbody.find_all('tr')
+        rows = tbody.xpath('./tr')
         logger.info(f"Found {len(rows)} seasons")
         
         for row in rows:
-            cells = row.find_all(['td', 'th'])
+            cells = row.xpath('./td|./th')
             if len(cells) >= 5:  # Ensure we have enough columns
                 season_data = self.parse_season_row(cells, competition_name, competition_id)
                 if season_data:
@@ -1,41 +1,34 @@
 import requests
 from bs4 import BeautifulSoup
 import re
-import time
 from typing import List, Dict, Any, Optional
 from urllib.parse import urljoin
 from pipeline.utils.logging import get_logger
-from pipeline.utils.cache import CacheManager
+from pipeline.utils.cache import get_cache_manager
+from pipeline.utils.scrape import get_session
+from pipeline.utils.rate_limit import get_rate_limiter
+from pipeline.utils.convert import safe_int
 
 logger = get_logger()
 
+
 class SeasonNationTournamentParser:
     """Base class for scraping FBref season data."""
     
-    def __init__(self, base_url: str = "https://fbref.com", pipeline_name: str = "season"):
+    def __init__(self, base_url: str = "https://fbref.com", pipeline_name: str = "season", session: Optional[requests.Session] = None):
         """
         Initialize the parser.
         
         Args:
             base_url: Base URL for FBref
             pipeline_name: Name of the pipeline for cache management
+            session: Optional HTTP session to share connections with other parsers
         """
         self.base_url = base_url
         self.pipeline_name = pipeline_name
-        self.cache_manager = CacheManager(pipeline_name)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0'
-        })
+        self.cache_manager = get_cache_manager(pipeline_name)
+        self.rate_limiter = get_rate_limiter()
+        self.session = session or get_session()
     
     def get_page(self, url: str, use_cache: bool = True) -> Optional[BeautifulSoup]:
         """
@@ -53,18 +46,18 @@ class SeasonNationTournamentParser:
                 cached_html = self.cache_manager.get_cached_html(url)
                 if cached_html:
                     logger.info(f"[CACHE] - {url}")
-                    return BeautifulSoup(cached_html, 'html.parser')
+                    return BeautifulSoup(cached_html, 'lxml')
             
             logger.info(f"Fetching fresh HTML: {url}")
+            self.rate_limiter.wait()  # Be respectful to the server
             response = self.session.get(url, timeout=30)
+            self.rate_limiter.record_response(response.status_code)
             response.raise_for_status()
             html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
             
             if use_cache:
                 self.cache_manager.cache_html(url, html_content)
-            
-            time.sleep(1)  # Be respectful to the server
             return soup
             
         except requests.RequestException as e:
@@ -127,10 +120,7 @@ class SeasonNationTournamentParser:
             # Extract number of squads (column 3)
             squads_cell = cells[3]
             squads_text = squads_cell.get_text(strip=True)
-            try:
-                num_squads = int(squads_text) if squads_text.isdigit() else None
-            except ValueError:
-                num_squads = None
+            num_squads = safe_int(squads_text)
             
             # Extract champion (column 4)
             champion_cell = cells[4]
@@ -152,25 +142,19 @@ class SeasonNationTournamentParser:
             
             if top_scorer_text and top_scorer_text != '':
                 # Handle format like "Kylian Mbappé - 8" or "Wesley Sneijder, Thomas Müller... - 5"
-                if '-' in top_scorer_text and not top_scorer_text.startswith('-'):
-                    # Split on the last dash to separate names from goals
-                    parts = top_scorer_text.rsplit('-', 1)
-                    if len(parts) == 2:
-                        scorer_names = parts[0].strip()
-                        try:
-                            top_goals = int(parts[1].strip())
-                        except ValueError:
-                            top_goals = None
-                        
-                        # Handle multiple scorers (remove ellipsis if present)
-                        if ',' in scorer_names:
-                            # Remove ellipsis from the end
-                            scorer_names = scorer_names.replace('...', '').strip()
-                            top_scorer = [name.strip() for name in scorer_names.split(',')]
-                        else:
-                            top_scorer = scorer_names
+                # Split on the last dash to separate names from goals
+                scorer_names, sep, goals_text = top_scorer_text.rpartition('-')
+                if sep and not top_scorer_text.startswith('-'):
+                    scorer_names = scorer_names.strip()
+                    top_goals = safe_int(goals_text.strip())
+                    
+                    # Handle multiple scorers (remove ellipsis if present)
+                    if ',' in scorer_names:
+                        # Remove ellipsis from the end
+                        scorer_names = scorer_names.replace('...', '').strip()
+                        top_scorer = [name.strip() for name in scorer_names.split(',')]
                     else:
-                        top_scorer = top_scorer_text
+                        top_scorer = scorer_names
                 else:
                     # No goals info or starts with dash
                     top_scorer = top_scorer_text
@@ -1,4 +1,5 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
@@ -8,11 +9,16 @@ sys.path.insert(0, str(project_root))
 
 from pipeline.utils.database import DatabaseManager
 from pipeline.utils.logging import get_logger
+from pipeline.utils.dates import get_current_seasons
 from pipeline.utils.scrape import UniversalScraper
+from pipeline.utils.store import BatchedStore
 from pipeline.stats.score_table.parse import ScoreTableParser
 
 logger = get_logger()
 
+# Ongoing seasons, resolved once from today's date
+_CURRENT_SEASONS = get_current_seasons()
+
 class ScoreTablePipeline:
     """Main pipeline for scraping FBref score table data."""
     
@@ -42,6 +48,9 @@ class ScoreTablePipeline:
                 
                 logger.info(f"Found {len(club_competitions)} club competitions in database")
                 
+                # Seasons of all domestic leagues, fetched in one query
+                seasons_by_competition = self.db_manager.get_all_domestic_seasons()
+                
                 # Filter for domestic leagues only and those with seasons data
                 competitions_with_seasons = []
                 for competition in club_competitions:
@@ -50,7 +59,7 @@ class ScoreTablePipeline:
                     
                     # Only process domestic leagues
                     if competition_type == 'domestic' and competition_id:
-                        seasons = self.db_manager.get_seasons(competition_id)
+                        seasons = seasons_by_competition.get(competition_id)
                         if seasons:
                             competition['seasons'] = seasons
                             competitions_with_seasons.append(competition)
@@ -62,15 +71,16 @@ class ScoreTablePipeline:
             logger.error(f"Failed to get competitions with seasons: {e}")
             return []
     
-    def scrape_score_tables_for_competition(self, competition: Dict[str, Any]) -> bool:
+    def scrape_score_tables_for_competition(self, competition: Dict[str, Any], max_workers: int = 8) -> Optional[Dict[str, List[Dict[str, Any]]]]:
         """
-        Scrape score tables for all seasons of a single DOMESTIC LEAGUE competition.
+        Scrape score tables for all seasons of a single DOMESTIC LEAGUE competition without storing them.
         
         Args:
             competition: Competition dictionary with seasons data
+            max_workers: Number of season pages to fetch concurrently
             
         Returns:
-            True if successful, False otherwise
+            Score tables keyed by season if successful, None otherwise
         """
         competition_name = competition.get('competition_name', 'Unknown')
         competition_id = competition.get('competition_id')
@@ -78,37 +88,27 @@ class ScoreTablePipeline:
         
         if not seasons:
             logger.warning(f"No seasons found for {competition_name}")
-            return False
+            return None
         
         try:
             score_tables_by_season = {}
             total_teams = 0
             
-            # Scrape each season page individually
-            for season_data in seasons:
-                season = season_data.get('season')
-                season_link = season_data.get('season_link')
-                
-                if not season_link:
-                    logger.warning(f"No season link for {competition_name} {season}")
-                    continue
-                
-                # Skip current ongoing season
-                if self._is_current_season(season):
-                    continue
-                
-                # Scrape HTML content for this season
-                soup = self.scraper.scrape_season_page(
-                    season_link, season, competition_name, competition_id
-                )
-                
-                if not soup:
+            # Collect the season pages to fetch, skipping the current ongoing season
+            pending_seasons = self.scraper.collect_season_pages(seasons, self._is_current_season, competition_name)
+            
+            # Fetch season pages concurrently; the scraper's shared rate limiter spaces out the requests
+            html_pages = self.scraper.scrape_season_htmls(pending_seasons, competition_name, competition_id, max_workers)
+            
+            # Parse the fetched pages in season order
+            for (season, _, _), html_content in zip(pending_seasons, html_pages):
+                if not html_content:
                     logger.warning(f"✗ {season}: Failed to scrape page")
                     continue
                 
                 # Parse regular score table
                 score_table_data = self.parser.parse_season_score_table(
-                    soup, season, competition_name, competition_id
+                    html_content, season, competition_name, competition_id
                 )
                 
                 if score_table_data:
@@ -120,18 +120,14 @@ class ScoreTablePipeline:
             
             if not score_tables_by_season:
                 logger.warning(f"No score table data found for {competition_name}")
-                return False
-            
-            # Store in database
-            with self.db_manager:
-                self.db_manager.insert_score_tables(competition_name, competition_id, score_tables_by_season)
+                return None
             
             logger.info(f"✅ {competition_name}: {total_teams} total team records across {len(score_tables_by_season)} seasons")
-            return True
+            return score_tables_by_season
             
         except Exception as e:
             logger.error(f"Failed to scrape score tables for {competition_name}: {e}")
-            return False
+            return None
     
     def _is_current_season(self, season: str) -> bool:
         """
@@ -143,57 +139,76 @@ class ScoreTablePipeline:
         Returns:
             True if it's the current season that should be skipped
         """
-        # Current ongoing seasons to skip
-        current_seasons = ["2025-2026", "2025"]
-        return season in current_seasons
+        return season in _CURRENT_SEASONS
     
-    def scrape_score_tables(self, competition_id: Optional[int] = None):
+    def scrape_score_tables(self, competition_id: Optional[int] = None, max_workers: int = 8, competition_workers: int = 4):
         """
         Run the complete score table scraping pipeline.
         
         Args:
             competition_id: Specific competition ID to scrape, or None for all
+            max_workers: Number of season pages to fetch concurrently per competition; only used when
+                         competitions are scraped one at a time
+            competition_workers: Number of competitions to scrape concurrently
         """
         logger.info("Starting Score Table Scraping Pipeline")
         
         try:
-            # Get competitions with seasons data
-            competitions = self.get_competitions_with_seasons()
-            
-            if not competitions:
-                logger.warning("No competitions with seasons found to scrape score tables for")
-                return
-            
-            # Filter by competition_id if specified
-            if competition_id is not None:
-                competitions = [c for c in competitions if c.get('competition_id') == competition_id]
-                if competitions:
-                    logger.info(f"Filtered to competition: {competitions[0]['competition_name']}")
-                else:
-                    logger.warning(f"No competition found with ID {competition_id}")
+            # One database connection for the whole run; nested `with` blocks reuse it
+            with self.db_manager:
+                # Get competitions with seasons data
+                competitions = self.get_competitions_with_seasons()
+            
+                if not competitions:
+                    logger.warning("No competitions with seasons found to scrape score tables for")
                     return
             
-            logger.info(f"Processing {len(competitions)} competitions...")
+                # Filter by competition_id if specified
+                if competition_id is not None:
+                    competitions = [c for c in competitions if c.get('competition_id') == competition_id]
+                    if competitions:
+                        logger.info(f"Filtered to competition: {competitions[0]['competition_name']}")
+                    else:
+                        logger.warning(f"No competition found with ID {competition_id}")
+                        return
             
-            # Initialize database tables
-            with self.db_manager:
+                logger.info(f"Processing {len(competitions)} competitions...")
+            
+                # Initialize database tables
                 self.db_manager.create_tables()
             
-            # Scrape score tables for each competition
-            successful_scrapes = 0
-            failed_scrapes = 0
+                # Scrape score tables for each competition
+                successful_scrapes = 0
+                failed_scrapes = 0
+                # Scraped score tables, stored in bulk every few competitions
+                store = BatchedStore(self.db_manager.insert_score_tables_bulk, self.db_manager.insert_score_tables)
+            
+                # One pool level: with competitions in parallel, each fetches its seasons one after another
+                season_workers = 1 if competition_workers > 1 else max_workers
+            
+                def scrape_competition(competition: Dict[str, Any]) -> Optional[Dict[str, List[Dict[str, Any]]]]:
+                    logger.info(f"⚽ {competition.get('competition_name', 'Unknown')}")
+                    return self.scrape_score_tables_for_competition(competition, season_workers)
             
-            for i, competition in enumerate(competitions, 1):
-                competition_name = competition.get('competition_name', 'Unknown')
-                logger.info(f"⚽ {competition_name}")
+                # Competitions are scraped concurrently; this thread is the only database writer
+                with store, ThreadPoolExecutor(max_workers=competition_workers) as executor:
+                    futures = {executor.submit(scrape_competition, competition): competition for competition in competitions}
                 
-                if self.scrape_score_tables_for_competition(competition):
-                    successful_scrapes += 1
-                else:
-                    failed_scrapes += 1
+                    for future in as_completed(futures):
+                        competition = futures[future]
+                        score_tables_by_season = future.result()
+                        if score_tables_by_season:
+                            store.add((competition.get('competition_name', 'Unknown'), competition.get('competition_id'), score_tables_by_season))
+                            successful_scrapes += 1
+                        else:
+                            failed_scrapes += 1
+                
+                # Competitions that were scraped but could not be stored count as failed
+                successful_scrapes -= store.failed
+                failed_scrapes += store.failed
             
-            # Simple summary
-            logger.info(f"✅ Score Table Scraping Completed: {successful_scrapes} successful, {failed_scrapes} failed")
+                # Simple summary
+                logger.info(f"✅ Score Table Scraping Completed: {successful_scrapes} successful, {failed_scrapes} failed")
             
         except Exception as e:
             logger.error(f"Pipeline failed: {e}")
@@ -1,11 +1,59 @@
 import re
-from bs4 import BeautifulSoup
-from typing import List, Dict, Any, Optional
+import sys
+import lxml.html
+from typing import List, Dict, Any, Optional, Tuple, Callable
 from pipeline.utils.logging import get_logger
 from pipeline.utils.mapping import METRIC_MAPPING
+from pipeline.utils.convert import cell_text
 
 logger = get_logger()
 
+# Numeric score table fields as (output field, normalized header, value type), in output order
+_NUMERIC_COLUMNS = (
+    ('matches_played', 'matches_played', 'int'),
+    ('wins', 'wins', 'int'),
+    ('draws', 'draws', 'int'),
+    ('losses', 'losses', 'int'),
+    ('goals_for', 'goals_for', 'int'),
+    ('goals_against', 'goals_against', 'int'),
+    ('goal_difference', 'goal_difference', 'int'),
+    ('points', 'points', 'int'),
+    ('expected_goals', 'expected_goals', 'float'),
+    ('expected_goals_allowed', 'expected_goals_allowed', 'float'),
+    ('expected_goals_difference', 'expected_goals_difference', 'float'),
+    ('expected_goals_difference_per_90_minutes', 'expected_goals_difference_per_90_minutes', 'float'),
+    ('avg_home_attendance', 'attendance', 'int'),
+)
+
+# Standings header labels (lowercased) mapped to normalized column keys, interned once
+_HEADER_MAP = {sys.intern(label): sys.intern(key) for label, key in {
+    'rk': 'rank',
+    'squad': 'team',
+    'mp': 'matches_played',
+    'w': 'wins',
+    'd': 'draws',
+    'l': 'losses',
+    'gf': 'goals_for',
+    'ga': 'goals_against',
+    'gd': 'goal_difference',
+    'pts': 'points',
+    'pts/mp': 'points_per_match_played',
+    'xg': 'expected_goals',
+    'xga': 'expected_goals_allowed',
+    'xgd': 'expected_goals_difference',
+    'xgd/90': 'expected_goals_difference_per_90_minutes',
+    'attendance': 'attendance',
+    'top team scorer': 'top_team_scorer',
+    'goalkeeper': 'goalkeeper',
+    'notes': 'notes'
+}.items()}
+
+_DIGITS = frozenset('0123456789')
+
+_SQUAD_ID_RE = re.compile(r'/en/squads/([a-f0-9]+)/')
+_COMP_ID_RE = re.compile(r'/comps/(\d+)/')
+
+
 class ScoreTableParser:
     """Class for parsing FBref score table data from HTML for domestic leagues."""
     
@@ -25,7 +73,7 @@ class ScoreTableParser:
         """
         try:
             # Pattern: /en/squads/{id}/...
-            match = re.search(r'/en/squads/([a-f0-9]+)/', squad_link)
+            match = _SQUAD_ID_RE.search(squad_link)
             if match:
                 return match.group(1)
             return None
@@ -35,69 +83,52 @@ class ScoreTableParser:
 
     def _normalize_header(self, text: str) -> str:
         t = (text or '').strip().lower()
-        mapping = {
-            'rk': 'rank',
-            'squad': 'team',
-            'mp': 'matches_played',
-            'w': 'wins',
-            'd': 'draws',
-            'l': 'losses',
-            'gf': 'goals_for',
-            'ga': 'goals_against',
-            'gd': 'goal_difference',
-            'pts': 'points',
-            'pts/mp': 'points_per_match_played',
-            'xg': 'expected_goals',
-            'xga': 'expected_goals_allowed',
-            'xgd': 'expected_goals_difference',
-            'xgd/90': 'expected_goals_difference_per_90_minutes',
-            'attendance': 'attendance',
-            'top team scorer': 'top_team_scorer',
-            'goalkeeper': 'goalkeeper',
-            'notes': 'notes'
-        }
-        return mapping.get(t, t)
+        return _HEADER_MAP.get(t, t)
 
-    def _extract_headers_map(self, standings_table: BeautifulSoup) -> Dict[str, int]:
+    def _extract_headers_map(self, standings_table: lxml.html.HtmlElement) -> Dict[str, int]:
         headers_map: Dict[str, int] = {}
-        thead = standings_table.find('thead')
-        if not thead:
-            return headers_map
-        header_cells = thead.find_all('th')
-        for idx, th in enumerate(header_cells):
-            norm = self._normalize_header(th.get_text(strip=True))
+        for idx, th in enumerate(standings_table.xpath('./thead//th')):
+            norm = self._normalize_header(cell_text(th))
             if norm:
                 headers_map[norm] = idx
         return headers_map
     
-    def parse_score_table_row(self, cells, season: str, headers_map: Dict[str, int]) -> Optional[Dict[str, Any]]:
+    def _resolve_numeric_columns(self, headers_map: Dict[str, int]) -> List[Tuple[str, Optional[int], Callable[[str], Any]]]:
+        """Resolve each numeric output field to its column index and parser for one table."""
+        parsers = {'int': self._parse_int, 'float': self._parse_float}
+        return [(field, headers_map.get(key), parsers[kind]) for field, key, kind in _NUMERIC_COLUMNS]
+    
+    def parse_score_table_row(self, texts: List[str], season: str, headers_map: Dict[str, int], squad_link_href: str = '', numeric_columns: Optional[List[Tuple[str, Optional[int], Callable[[str], Any]]]] = None, squad_link_text: Optional[str] = None) -> Optional[Dict[str, Any]]:
         """
         Parse a score table row from the standings table.
         
         Args:
-            cells: List of table cells
+            texts: Stripped text of each cell in the row
             season: Season string (e.g., "2024-2025")
+            headers_map: Normalized header name to column index
+            squad_link_href: Link of the squad in the team cell, if any
+            numeric_columns: Output of _resolve_numeric_columns for this table, resolved here if omitted
+            squad_link_text: Text of the squad link in the team cell; the cell text is used if there is no link
             
         Returns:
             Dictionary with score table data or None if parsing failed
         """
         try:
-            if len(cells) < 10:  # Ensure we have enough columns
-                logger.warning(f"Expected at least 10 columns, got {len(cells)}")
+            if len(texts) < 10:  # Ensure we have enough columns
+                logger.warning(f"Expected at least 10 columns, got {len(texts)}")
                 return None
             
             # Extract rank (may be text; not mandatory integer)
             rank_idx = headers_map.get('rank', 0)
-            rank_cell = cells[rank_idx] if rank_idx < len(cells) else cells[0]
-            rank_text = rank_cell.get_text(strip=True)
+            rank_text = texts[rank_idx] if rank_idx < len(texts) else texts[0]
             rank_value = self._parse_rank(rank_text)
 
             # Extract squad name and link
             team_idx = headers_map.get('team', 1)
-            squad_cell = cells[team_idx] if team_idx < len(cells) else cells[1]
-            squad_link = squad_cell.find('a')
-            squad_name = squad_link.get_text(strip=True) if squad_link else squad_cell.get_text(strip=True)
-            squad_link_href = squad_link.get('href', '') if squad_link else ''
+            if squad_link_text is not None:
+                squad_name = squad_link_text
+            else:
+                squad_name = texts[team_idx] if team_idx < len(texts) else texts[1]
             squad_id = self.extract_squad_id(squad_link_href) if squad_link_href else None
             # Skip non-team rows (e.g., group separators) or blank rows
             if not squad_name:
@@ -114,23 +145,15 @@ class ScoreTableParser:
             # Helper to safely read a column by normalized header key
             def read_col(key: str) -> Optional[str]:
                 idx = headers_map.get(key)
-                if idx is None or idx >= len(cells):
+                if idx is None or idx >= len(texts):
                     return None
-                return cells[idx].get_text(strip=True)
+                return texts[idx]
 
-            score_data['matches_played'] = self._parse_int(read_col('matches_played') or '')
-            score_data['wins'] = self._parse_int(read_col('wins') or '')
-            score_data['draws'] = self._parse_int(read_col('draws') or '')
-            score_data['losses'] = self._parse_int(read_col('losses') or '')
-            score_data['goals_for'] = self._parse_int(read_col('goals_for') or '')
-            score_data['goals_against'] = self._parse_int(read_col('goals_against') or '')
-            score_data['goal_difference'] = self._parse_int(read_col('goal_difference') or '')
-            score_data['points'] = self._parse_int(read_col('points') or '')
-            score_data['expected_goals'] = self._parse_float(read_col('expected_goals') or '')
-            score_data['expected_goals_allowed'] = self._parse_float(read_col('expected_goals_allowed') or '')
-            score_data['expected_goals_difference'] = self._parse_float(read_col('expected_goals_difference') or '')
-            score_data['expected_goals_difference_per_90_minutes'] = self._parse_float(read_col('expected_goals_difference_per_90_minutes') or '')
-            score_data['avg_home_attendance'] = self._parse_int(read_col('attendance') or '')
+            # Numeric columns, resolved to (field, column index, parser) once per table
+            if numeric_columns is None:
+                numeric_columns = self._resolve_numeric_columns(headers_map)
+            for field, idx, parse in numeric_columns:
+                score_data[field] = parse(texts[idx] if idx is not None and idx < len(texts) else '')
 
             # Top Team Scorer
             scorer_text = read_col('top_team_scorer') or ''
@@ -162,11 +185,9 @@ class ScoreTableParser:
         if not text:
             return None
         t = text.strip()
-        if t.isdigit():
-            try:
-                return int(t)
-            except ValueError:
-                return None
+        # Cheap first-character check before the full scan; isdecimal() guarantees int() succeeds
+        if t[:1] in _DIGITS and t.isdecimal():
+            return int(t)
         return t  # keep textual ranks like 'GR', 'QF', 'SF' if ever present
 
     
@@ -191,28 +212,37 @@ class ScoreTableParser:
             return text
         return float(text)
     
-    def find_standings_table(self, soup: BeautifulSoup, competition_name: str, season: str) -> Optional[BeautifulSoup]:
+    def find_standings_table(self, tree: lxml.html.HtmlElement, competition_name: str, season: str) -> Optional[lxml.html.HtmlElement]:
         """
-        Find the standings table in the HTML soup.
+        Find the standings table in the parsed page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            tree: lxml root element of the page
             competition_name: Name of the competition
             season: Season string
             
         Returns:
-            BeautifulSoup object of the standings table or None if not found
+            lxml element of the standings table or None if not found
         """
-        # Find the standings table - try different possible IDs
-        standings_table = None
+        # Collect every table with 'results' in its ID in one XPath pass, in document order
+        candidates = tree.xpath(
+            '//table[contains(translate(@id, "RESULTSOVA", "resultsova"), "results")]'
+        )
+        tables_by_id = {}
+        for table in candidates:
+            tables_by_id.setdefault(table.get('id'), table)
         
         # Try the standard 'results' ID first
-        standings_table = soup.find('table', {'id': 'results'})
+        standings_table = tables_by_id.get('results')
         
         # If not found, try the pattern 'results{competition_id}{season_id}_overall'
-        if not standings_table:
-            # Extract competition ID from URL if possible
-            competition_id_match = re.search(r'/comps/(\d+)/', str(soup))
+        if standings_table is None:
+            # Extract competition ID from the page links if possible
+            competition_id_match = None
+            for href in tree.xpath('//@href[contains(., "/comps/")]'):
+                competition_id_match = _COMP_ID_RE.search(href)
+                if competition_id_match:
+                    break
             if competition_id_match:
                 comp_id = competition_id_match.group(1)
                 # Try different patterns
@@ -223,33 +253,32 @@ class ScoreTableParser:
                 ]
                 
                 for table_id in possible_ids:
-                    standings_table = soup.find('table', {'id': table_id})
-                    if standings_table:
+                    standings_table = tables_by_id.get(table_id)
+                    if standings_table is not None:
                         logger.info(f"Found standings table with ID: {table_id}")
                         break
         
-        # If still not found, look for any table with 'results' in the ID
-        if not standings_table:
-            all_tables = soup.find_all('table')
-            for table in all_tables:
+        # If still not found, look for any table with 'results' and 'overall' in the ID
+        if standings_table is None:
+            for table in candidates:
                 table_id = table.get('id', '')
-                if 'results' in table_id.lower() and 'overall' in table_id.lower():
+                if 'overall' in table_id.lower():
                     standings_table = table
                     logger.info(f"Found standings table with ID: {table_id}")
                     break
         
-        if not standings_table:
+        if standings_table is None:
             logger.warning(f"Standings table not found for {competition_name} {season}")
             return None
         
         return standings_table
     
-    def parse_season_score_table(self, soup: BeautifulSoup, season: str, competition_name: str, competition_id: int) -> List[Dict[str, Any]]:
+    def parse_season_score_table(self, html_content: str, season: str, competition_name: str, competition_id: int) -> List[Dict[str, Any]]:
         """
-        Parse score table data from HTML soup for a specific season.
+        Parse score table data from the HTML of a specific season page.
         
         Args:
-            soup: BeautifulSoup object of the season page
+            html_content: Raw HTML of the season page
             season: Season string (e.g., "2024-2025")
             competition_name: Name of the competition
             competition_id: ID of the competition
@@ -260,24 +289,36 @@ class ScoreTableParser:
         logger.info(f"Parsing {competition_name} {season} score table...")
         
         # Find the standings table
-        standings_table = self.find_standings_table(soup, competition_name, season)
-        if not standings_table:
+        tree = lxml.html.fromstring(html_content)
+        standings_table = self.find_standings_table(tree, competition_name, season)
+        if standings_table is None:
             return []
         
         headers_map = self._extract_headers_map(standings_table)
         score_table_data = []
         tbody = standings_table.find('tbody')
-        if not tbody:
+        if tbody is None:
             logger.warning(f"Standings table body not found for {competition_name} {season}")
             return []
         
-        rows = tbody.find_all('tr')
+        rows = tbody.xpath('.//tr')
         logger.info(f"Found {len(rows)} teams in {season}")
         
+        team_idx = headers_map.get('team', 1)
+        numeric_columns = self._resolve_numeric_columns(headers_map)
         for row in rows:
-            cells = row.find_all(['td', 'th'])
+            cells = row.xpath('./td|./th')
             if len(cells) >= 10:  # Ensure we have enough columns
-                score_data = self.parse_score_table_row(cells, season, headers_map)
+                texts = [cell_text(cell) for cell in cells]
+                squad_cell = cells[team_idx] if team_idx < len(cells) else cells[1]
+                # The squad name is the link text; the cell also holds flag and crest text around it
+                squad_link = next(squad_cell.iter('a'), None)
+                if squad_link is not None:
+                    score_data = self.parse_score_table_row(
+                        texts, season, headers_map, squad_link.get('href', ''), numeric_columns, cell_text(squad_link)
+                    )
+                else:
+                    score_data = self.parse_score_table_row(texts, season, headers_map, '', numeric_columns)
                 if score_data:
                     score_table_data.append(score_data)
         
@@ -1,6 +1,7 @@
 import sys
 from pathlib import Path
 from typing import List, Dict, Any, Optional
+from bs4 import BeautifulSoup
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent.parent
@@ -8,11 +9,15 @@ sys.path.insert(0, str(project_root))
 
 from pipeline.utils.database import DatabaseManager
 from pipeline.utils.logging import get_logger
+from pipeline.utils.dates import get_current_seasons
 from pipeline.utils.scrape import UniversalScraper
 from pipeline.stats.score_table_tournament.nation.parse import ScoreTableParser
 
 logger = get_logger()
 
+# Ongoing seasons, resolved once from today's date
+_CURRENT_SEASONS = get_current_seasons(include_both_years=True)
+
 
 class ScoreTableTournamentClubPipeline:
     """Pipeline to scrape League Table for national tournaments (per-season pages)."""
@@ -57,12 +62,13 @@ class ScoreTableTournamentClubPipeline:
             logger.error(f"Failed to get competitions with seasons: {e}")
             return []
 
-    def scrape_score_tables_for_competition(self, competition: Dict[str, Any]) -> bool:
+    def scrape_score_tables_for_competition(self, competition: Dict[str, Any], max_workers: int = 8) -> bool:
         """
         Scrape score tables for all seasons of a single CLUB TOURNAMENT competition.
         
         Args:
             competition: Competition dictionary with seasons data
+            max_workers: Number of season pages to fetch concurrently
             
         Returns:
             True if successful, False otherwise
@@ -79,28 +85,20 @@ class ScoreTableTournamentClubPipeline:
             score_tables_by_season = {}
             total_teams = 0
             
-            # Scrape each season page individually (from newest to oldest)
-            for season_data in reversed(seasons):
-                season = season_data.get('season')
-                season_link = season_data.get('season_link')
-                
-                if not season_link:
-                    logger.warning(f"No season link for {competition_name} {season}")
-                    continue
-                
-                # Skip current ongoing season
-                if self._is_current_season(season):
-                    continue
-                
-                # Scrape HTML content for this season
-                soup = self.scraper.scrape_season_page(
-                    season_link, season, competition_name, competition_id
-                )
-                
-                if not soup:
+            # Collect the season pages to fetch, skipping the current ongoing season
+            pending_seasons = self.scraper.collect_season_pages(seasons, self._is_current_season, competition_name)
+            
+            # Fetch season pages concurrently (from newest to oldest); the shared rate limiter spaces out the requests
+            pending_seasons.reverse()
+            html_pages = self.scraper.scrape_season_htmls(pending_seasons, competition_name, competition_id, max_workers)
+            
+            for (season, _, _), html_content in zip(pending_seasons, html_pages):
+                if not html_content:
                     logger.warning(f"✗ {season}: Failed to scrape page")
                     continue
                 
+                soup = BeautifulSoup(html_content, self.scraper.parser)
+                
                 # Parse tournament score table
                 score_table_data = self.parser.parse_season_score_table(
                     soup, season, competition_name, competition_id
@@ -140,9 +138,7 @@ class ScoreTableTournamentClubPipeline:
         Returns:
             True if it's the current season that should be skipped
         """
-        # Current ongoing seasons to skip
-        current_seasons = ["2025-2026", "2025", "2026"]
-        return season in current_seasons
+        return season in _CURRENT_SEASONS
     
     def scrape_score_tables(self, competition_id: Optional[int] = None):
         """
@@ -1,7 +1,16 @@
+import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 import json
+from bs4 import BeautifulSoup
+
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the standard json module
+    orjson = None
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
@@ -9,14 +18,19 @@ sys.path.insert(0, str(project_root))
 
 from pipeline.utils.logging import get_logger
 from pipeline.utils.database import DatabaseManager
-from pipeline.utils.scrape import UniversalScraper
-from pipeline.fixture.parse import FixtureParser
 from pipeline.fixture.main import FixturePipeline
 from pipeline.cli import CompId
 
 logger = get_logger()
 
-def scrape_fixture_for_competition(pipeline, competition: Dict[str, Any], refresh_current_season: bool = False, years_back: int = 1):
+# DatabaseManager method that loads a competition's seasons, by competition type (default: get_seasons)
+_SEASONS_FETCHERS = {
+    'domestic': 'get_seasons',
+    'international': 'get_club_tournament_seasons',
+    'national': 'get_nation_tournament_seasons',
+}
+
+def scrape_fixture_for_competition(pipeline, competition: Dict[str, Any], refresh_current_season: bool = False, years_back: int = 1, max_workers: int = 8):
     """Scrape fixtures for all seasons of a competition."""
     competition_name = competition.get('competition_name', 'Unknown')
     competition_id = competition.get('competition_id')
@@ -27,7 +41,12 @@ def scrape_fixture_for_competition(pipeline, competition: Dict[str, Any], refres
         return None
     
     fixtures_by_season = {}
+    # Reuse the pipeline's scraper and parser so every season shares one HTTP session and cache connection
+    scraper = pipeline.scraper
+    parser = pipeline.parser
     
+    # Collect the season pages to fetch as (season, fixture_link, use_cache)
+    pending_seasons = []
     for season_data in seasons:
         season = season_data.get('season')
         season_link = season_data.get('season_link')
@@ -46,15 +65,17 @@ def scrape_fixture_for_competition(pipeline, competition: Dict[str, Any], refres
                 continue
             use_cache = not refresh_current_season
 
-        scraper = UniversalScraper(pipeline_name="fixture")
-        soup = scraper.scrape_season_page(
-            fixture_link, season, competition_name, competition_id, use_cache=use_cache
-        )
-        
-        if not soup:
+        pending_seasons.append((season, fixture_link, use_cache))
+    
+    # Fetch season pages concurrently; the scraper's shared rate limiter spaces out the requests
+    html_pages = scraper.scrape_season_htmls(pending_seasons, competition_name, competition_id, max_workers)
+    
+    # Parse the fetched pages in season order
+    for (season, _, _), html_content in zip(pending_seasons, html_pages):
+        if not html_content:
             continue
         
-        parser = FixtureParser()
+        soup = BeautifulSoup(html_content, scraper.parser)
         
         if competition_type == 'domestic':
             fixture_data = parser.parse_fixture(
@@ -70,112 +91,145 @@ def scrape_fixture_for_competition(pipeline, competition: Dict[str, Any], refres
     
     return fixtures_by_season if fixtures_by_season else None
 
-def scrape_fixtures(competition_id: int, refresh_current_season: bool = False, years_back: int = 1):
-    """Scrape fixtures and return nested structure."""
+def _index_competitions(comps: List[Dict[str, Any]]) -> Dict[int, Dict[str, Any]]:
+    """Key competitions by competition_id."""
+    return {comp.get('competition_id'): comp for comp in comps}
+
+def scrape_fixtures(competition_id: int, refresh_current_season: bool = False, years_back: int = 1, comps_by_id: Optional[Dict[int, Dict[str, Any]]] = None, season_workers: int = 8) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Scrape fixtures and return the nested structure together with its timeline."""
     pipeline = FixturePipeline()
-    db_manager = DatabaseManager(db_path="database/fbref_database.db")
-    
-    comps = db_manager.get_competitions('competition_club')
-    
-    competition = None
-    for comp in comps:
-        if comp.get('competition_id') == competition_id:
-            competition = comp
-            comp_type = comp.get('competition_type', 'domestic')
-            if comp_type == 'domestic':
-                comp['seasons'] = db_manager.get_seasons(competition_id)
-            elif comp_type == 'international':
-                comp['seasons'] = db_manager.get_club_tournament_seasons(competition_id)
-            elif comp_type == 'national':
-                comp['seasons'] = db_manager.get_nation_tournament_seasons(competition_id)
-            else:
-                comp['seasons'] = db_manager.get_seasons(competition_id)
-            break
-    
-    if not competition:
-        return {}
-    
-    fixture_data = scrape_fixture_for_competition(pipeline, competition, refresh_current_season, years_back)
+    
+    with DatabaseManager(db_path="database/fbref_database.db") as db_manager:
+        # Callers scraping several competitions pass the lookup in, so the table is read only once
+        if comps_by_id is None:
+            comps_by_id = _index_competitions(db_manager.get_competitions('competition_club'))
+        
+        competition = comps_by_id.get(competition_id)
+        if not competition:
+            return {}, {}
+        
+        fetcher_name = _SEASONS_FETCHERS.get(competition.get('competition_type', 'domestic'), 'get_seasons')
+        competition['seasons'] = getattr(db_manager, fetcher_name)(competition_id)
+    
+    fixture_data = scrape_fixture_for_competition(pipeline, competition, refresh_current_season, years_back, season_workers)
     if not fixture_data:
-        return {}
+        return {}, {}
     
     # Group fixtures by week: {season: {week: {game1: {...}}}}
     fixture_structure = {}
     for season, fixtures in fixture_data.items():
         if fixtures:
-            fixtures_by_week = {}
+            fixtures_by_week = defaultdict(dict)
+            games_per_week = defaultdict(int)
             for fixture in fixtures:
                 week = f'week {fixture.get("week")}'
-                if week not in fixtures_by_week:
-                    fixtures_by_week[week] = {}
-                game_key = f"game{len(fixtures_by_week[week]) + 1}"
-                fixtures_by_week[week][game_key] = fixture
-            fixture_structure[season] = fixtures_by_week
+                games_per_week[week] += 1
+                fixtures_by_week[week][f"game{games_per_week[week]}"] = fixture
+            
+            fixture_structure[season] = dict(fixtures_by_week)
     
-    return fixture_structure
+    return fixture_structure, get_fixture_time_from_fixture_structure(fixture_structure)
 
 def get_fixture_time_from_fixture_structure(fixture_structure: Dict[str, Any]) -> Dict[str, Any]:
     """Extract timeline from fixture structure."""
     timeline = {}
     
     for season, fixtures_by_week in fixture_structure.items():
-        timeline[season] = {}
+        season_timeline = timeline[season] = {}
         
         for week, fixtures_by_game in fixtures_by_week.items():
-            dates = []
-            for game_key, fixture_data in fixtures_by_game.items():
-                date = fixture_data.get('date')
-                time = fixture_data.get('time')
-                if date:
-                    datetime_str = f'{date}' + (f' {time}' if time else '')
-                    dates.append(datetime_str)
+            # Earliest kick-off of the week in one pass, without building and sorting a list
+            earliest = min(
+                (
+                    f'{date} {time}' if time else f'{date}'
+                    for date, time in ((fixture_data.get('date'), fixture_data.get('time')) for fixture_data in fixtures_by_game.values())
+                    if date
+                ),
+                default=None
+            )
             
-            if dates:
-                timeline[season][week] = sorted(dates)[0]
+            if earliest:
+                season_timeline[week] = earliest
     
     return timeline
 
 
 def save_timeline_to_json(timelines: Dict[str, Any], output_dir: str = "timelines"):
     """Save timeline to JSON file."""
-    import os
-    
     os.makedirs(output_dir, exist_ok=True)
     output_file = os.path.join(output_dir, "2025-2026_top10_european_leagues_timeline.json")
     
-    with open(output_file, 'w') as f:
-        json.dump(timelines, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # Serialized in C straight to UTF-8 bytes, same layout as json's indent=2
+        payload = orjson.dumps(timelines, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(timelines, indent=2, ensure_ascii=False).encode('utf-8')
+    
+    # Write to a temporary file and swap it in, so readers never see a half-written timeline
+    tmp_file = output_file + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_file, output_file)
     
     return output_file
 
 
-def run_pipeline(competition_id: int = None, refresh_current_season: bool = False, years_back: int = 1):
+def _process_one(comp: Dict[str, Any], refresh_current_season: bool, years_back: int, comps_by_id: Dict[int, Dict[str, Any]]) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """Scrape one league's fixtures and build its timeline."""
+    comp_name = comp.get('competition_name', 'Unknown')
+    # Leagues already run in parallel, so each league fetches its seasons one after another
+    fixture_structure, timeline = scrape_fixtures(comp.get('competition_id'), refresh_current_season, years_back, comps_by_id, season_workers=1)
+    if not fixture_structure:
+        return comp_name, None
+    return comp_name, timeline
+
+
+def run_pipeline(competition_id: int = None, refresh_current_season: bool = False, years_back: int = 1, max_workers: int = 8):
     """Scrape fixtures and save timeline for all domestic leagues."""
-    db_manager = DatabaseManager(db_path="database/fbref_database.db")
-    comps = db_manager.get_competitions('competition_club')
+    with DatabaseManager(db_path="database/fbref_database.db") as db_manager:
+        comps = db_manager.get_competitions('competition_club')
+    comps_by_id = _index_competitions(comps)
     
     if competition_id is None:
+        domestic_comps = [comp for comp in comps if comp.get('competition_type') == 'domestic']
+        timelines_by_name = {}
+        
+        # Leagues are scraped concurrently; each worker opens its own database cursor, while the
+        # HTTP session, rate limiter and page cache are shared by the whole process
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_process_one, comp, refresh_current_season, years_back, comps_by_id): comp
+                for comp in domestic_comps
+            }
+            for future in as_completed(futures):
+                try:
+                    comp_name, timeline = future.result()
+                except Exception as e:
+                    # One league failing must not cost the others their timelines
+                    logger.error(f"Failed to update {futures[future].get('competition_name', 'Unknown')}: {e}")
+                    continue
+                if timeline:
+                    timelines_by_name[comp_name] = timeline
+        
+        # Keep the leagues in database order so the saved file is stable between runs
         all_timelines = {}
-        for comp in comps:
-            if comp.get('competition_type') == 'domestic':
-                comp_id = comp.get('competition_id')
-                comp_name = comp.get('competition_name', 'Unknown')
-                
-                fixture_structure = scrape_fixtures(comp_id, refresh_current_season, years_back)
-                if fixture_structure:
-                    timeline = get_fixture_time_from_fixture_structure(fixture_structure)
-                    all_timelines[comp_name] = timeline
+        for comp in domestic_comps:
+            comp_name = comp.get('competition_name', 'Unknown')
+            if comp_name in timelines_by_name:
+                all_timelines[comp_name] = timelines_by_name[comp_name]
         
         output_file = save_timeline_to_json(all_timelines)
         logger.info(f"✅ Saved: {output_file}")
         return all_timelines
     else:
-        fixture_structure = scrape_fixtures(competition_id, refresh_current_season, years_back)
+        fixture_structure, fixture_timeline = scrape_fixtures(competition_id, refresh_current_season, years_back, comps_by_id)
         if not fixture_structure:
             return
         
-        fixture_timeline = get_fixture_time_from_fixture_structure(fixture_structure)
-        comp_name = next((c.get('competition_name', 'Unknown') for c in comps if c.get('competition_id') == competition_id), f"Competition_{competition_id}")
+        comp = comps_by_id.get(competition_id)
+        comp_name = comp.get('competition_name', 'Unknown') if comp else f"Competition_{competition_id}"
         
         output_file = save_timeline_to_json({comp_name: fixture_timeline})
         logger.info(f"✅ Saved: {output_file}")
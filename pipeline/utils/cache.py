@@ -1,15 +1,85 @@
+import atexit
+import hashlib
 import sqlite3
 import os
+import threading
+import zlib
 from pathlib import Path
-from typing import Optional, Dict, Any
-from datetime import datetime
+from typing import Optional, Dict, Any, Iterable, Tuple
+from datetime import datetime, timedelta, timezone
 from pipeline.utils.logging import get_logger
 
 logger = get_logger()
 
+try:
+    import zstandard
+except ImportError:  # Optional: pages are zlib-compressed without it
+    zstandard = None
+
+# Frame magic number that starts every zstd-compressed blob
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+
+def _compress_html(html_content: str) -> bytes:
+    """Compress HTML for storage in the cache, with zstd when it is installed."""
+    data = html_content.encode('utf-8')
+    if zstandard is not None:
+        # Compressor objects are not thread-safe, and are cheap to create per page
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data)
+
+
+def _url_hash(url: str) -> int:
+    """Key a URL by a signed 64-bit hash so cache lookups compare integers, not long strings."""
+    return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'little', signed=True)
+
+
+def _decompress_html(stored_content) -> str:
+    """Restore cached HTML; rows written before compression was added are plain text."""
+    if isinstance(stored_content, bytes):
+        if stored_content.startswith(_ZSTD_MAGIC):
+            if zstandard is None:
+                raise RuntimeError("Cached page is zstd-compressed but the zstandard package is not installed")
+            return zstandard.ZstdDecompressor().decompress(stored_content).decode('utf-8')
+        return zlib.decompress(stored_content).decode('utf-8')
+    return stored_content
+
+
 class CacheManager:
     """Manages HTML caching using separate SQLite files for each pipeline."""
     
+    # Compressed FBref pages run to tens of KB, so larger pages mean shorter overflow chains per row
+    _PAGE_SIZE = 16384
+    # url_hash is the rowid, so lookups are integer B-tree searches; url is kept to guard against collisions
+    _SQL_CREATE = """
+        CREATE TABLE IF NOT EXISTS html_cache (
+            url_hash INTEGER PRIMARY KEY,
+            url TEXT NOT NULL,
+            html_content BLOB NOT NULL,
+            cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            etag TEXT,
+            last_modified TEXT
+        )
+    """
+    # HTTP validators, added after the table layout above first shipped
+    _VALIDATOR_COLUMNS = ('etag', 'last_modified')
+    # Covers the metadata reads (stats, listing, age-based clearing), which would otherwise walk each
+    # row past its html_content overflow pages to reach cached_at
+    _SQL_CREATE_INDEX = "CREATE INDEX IF NOT EXISTS idx_html_cache_cached_at ON html_cache (cached_at, url)"
+    # Hot statements, kept as constants so the connection's statement cache reuses their compiled form
+    _SQL_PUT = """
+        INSERT OR REPLACE INTO html_cache (url_hash, url, html_content, cached_at, last_accessed, etag, last_modified)
+        VALUES (?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, ?, ?)
+    """
+    _SQL_GET = "SELECT html_content, url FROM html_cache WHERE url_hash = ?"
+    _SQL_GET_VALIDATORS = "SELECT etag, last_modified, url FROM html_cache WHERE url_hash = ?"
+    _SQL_REVALIDATED = "UPDATE html_cache SET cached_at = CURRENT_TIMESTAMP, last_accessed = CURRENT_TIMESTAMP WHERE url_hash = ?"
+    _SQL_DELETE_OLDER_THAN = "DELETE FROM html_cache WHERE cached_at < ?"
+    _SQL_TOUCH = "UPDATE html_cache SET last_accessed = CURRENT_TIMESTAMP WHERE url_hash = ?"
+    # Cache hits are recorded in memory and written to last_accessed in batches of this size
+    _TOUCH_FLUSH_SIZE = 256
+    
     def __init__(self, pipeline_name: str = "competition"):
         """
         Initialize cache manager for a specific pipeline.
@@ -22,58 +92,139 @@ class CacheManager:
         self.cache_dir.mkdir(exist_ok=True)
         
         self.cache_file = self.cache_dir / f"{pipeline_name}_cache.db"
+        # One connection for the lifetime of the manager, shared by scraper threads
+        self._lock = threading.Lock()
+        # url_hash of cache hits whose last_accessed has not been written yet
+        self._pending_touches = set()
+        self._conn = self._connect()
         self._init_cache_db()
+        atexit.register(self.close)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection to the cache database with per-connection tuning applied."""
+        # Autocommit mode: every statement here is a single-row write or a read
+        conn = sqlite3.connect(str(self.cache_file), isolation_level=None, check_same_thread=False, cached_statements=256)
+        conn.execute("PRAGMA synchronous=NORMAL")  # Safe with WAL, skips an fsync per commit
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        conn.execute("PRAGMA cache_size=-16000")  # ~16 MiB page cache
+        return conn
     
     def _init_cache_db(self):
         """Initialize the cache database."""
         try:
-            conn = sqlite3.connect(str(self.cache_file))
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS html_cache (
-                    url TEXT PRIMARY KEY,
-                    html_content TEXT NOT NULL,
-                    cached_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    last_accessed TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
+            with self._lock:
+                # page_size and auto_vacuum apply to a new file right away, and to an existing one after a VACUUM
+                self._conn.execute(f"PRAGMA page_size={self._PAGE_SIZE}")
+                self._conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                if self._conn.execute("PRAGMA page_size").fetchone()[0] != self._PAGE_SIZE:
+                    self._rebuild_with_page_size()
+                # WAL is persistent, so every later connection to this file uses it
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                
+                # Files created before URLs were hash-keyed are rebuilt once
+                columns = [row[1] for row in self._conn.execute("PRAGMA table_info(html_cache)")]
+                if columns and 'url_hash' not in columns:
+                    self._migrate_to_url_hash()
+                
+                self._conn.execute(self._SQL_CREATE)
+                self._conn.execute(self._SQL_CREATE_INDEX)
+                
+                # Files created before HTTP validators were stored gain the columns in place
+                columns = [row[1] for row in self._conn.execute("PRAGMA table_info(html_cache)")]
+                for column in self._VALIDATOR_COLUMNS:
+                    if column not in columns:
+                        self._conn.execute(f"ALTER TABLE html_cache ADD COLUMN {column} TEXT")
             
-            conn.commit()
-            conn.close()
-            logger.debug(f"Initialized cache database: {self.cache_file}")
+            logger.debug("Initialized cache database: %s", self.cache_file)
             
         except Exception as e:
             logger.error(f"Failed to initialize cache database: {e}")
             raise
     
-    def cache_html(self, url: str, html_content: str):
+    def _rebuild_with_page_size(self):
+        """VACUUM an existing cache file into the current page size. Caller holds the lock."""
+        logger.info(f"Rebuilding cache database with {self._PAGE_SIZE}-byte pages: {self.cache_file}")
+        try:
+            # The page size of a WAL database cannot change, so rebuild in rollback-journal mode
+            self._conn.execute("PRAGMA journal_mode=DELETE")
+            self._conn.execute("VACUUM")
+        except sqlite3.OperationalError as e:
+            # Another process has the file open; keep the old layout and retry on a later run
+            logger.warning(f"Could not rebuild cache database {self.cache_file}: {e}")
+    
+    def _migrate_to_url_hash(self):
+        """Rebuild a URL-keyed html_cache table with url_hash keys. Caller holds the lock."""
+        logger.info(f"Migrating cache database to hashed URL keys: {self.cache_file}")
+        self._conn.create_function("url_hash", 1, _url_hash, deterministic=True)
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.execute("ALTER TABLE html_cache RENAME TO html_cache_legacy")
+            self._conn.execute(self._SQL_CREATE)
+            self._conn.execute("""
+                INSERT OR REPLACE INTO html_cache (url_hash, url, html_content, cached_at, last_accessed)
+                SELECT url_hash(url), url, html_content, cached_at, last_accessed FROM html_cache_legacy
+            """)
+            self._conn.execute("DROP TABLE html_cache_legacy")
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+    
+    def cache_html(self, url: str, html_content: str, etag: Optional[str] = None, last_modified: Optional[str] = None):
         """
         Cache HTML content for a URL.
         
         Args:
             url: URL that was scraped
             html_content: HTML content to cache
+            etag: ETag response header, used to revalidate the page later
+            last_modified: Last-Modified response header, used to revalidate the page later
         """
         try:
-            conn = sqlite3.connect(str(self.cache_file))
-            cursor = conn.cursor()
+            compressed = _compress_html(html_content)
             
             # Insert or replace cache entry
-            cursor.execute("""
-                INSERT OR REPLACE INTO html_cache (url, html_content, cached_at, last_accessed)
-                VALUES (?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-            """, (url, html_content))
-            
-            conn.commit()
-            conn.close()
+            with self._lock:
+                self._conn.execute(self._SQL_PUT, (_url_hash(url), url, compressed, etag, last_modified))
             
-            logger.debug(f"Cached HTML for URL: {url}")
+            logger.debug("Cached HTML for URL: %s", url)
             
         except Exception as e:
             logger.error(f"Failed to cache HTML for {url}: {e}")
             raise
     
+    def cache_html_many(self, pages: Iterable[Tuple[str, str, Optional[str], Optional[str]]]):
+        """
+        Cache HTML content for several URLs in a single transaction.
+        
+        Args:
+            pages: (url, html_content, etag, last_modified) tuples to cache
+        """
+        rows = [
+            (_url_hash(url), url, _compress_html(html_content), etag, last_modified)
+            for url, html_content, etag, last_modified in pages
+        ]
+        if not rows:
+            return
+        
+        try:
+            with self._lock:
+                # The connection is in autocommit mode, so group the writes into one commit explicitly
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.executemany(self._SQL_PUT, rows)
+                    self._conn.execute("COMMIT")
+                except Exception:
+                    self._conn.execute("ROLLBACK")
+                    raise
+            
+            logger.debug("Cached HTML for %s URLs", len(rows))
+            
+        except Exception as e:
+            logger.error(f"Failed to cache HTML for {len(rows)} URLs: {e}")
+            raise
+    
     def get_cached_html(self, url: str) -> Optional[str]:
         """
         Retrieve cached HTML content for a URL.
@@ -84,32 +235,76 @@ class CacheManager:
         Returns:
             Cached HTML content or None if not found
         """
+        url_hash = _url_hash(url)
         try:
-            conn = sqlite3.connect(str(self.cache_file))
-            cursor = conn.cursor()
+            with self._lock:
+                result = self._conn.execute(self._SQL_GET, (url_hash,)).fetchone()
+                if result:
+                    # Reads stay read-only; last accessed timestamps are written in batches
+                    self._pending_touches.add(url_hash)
+                    if len(self._pending_touches) >= self._TOUCH_FLUSH_SIZE:
+                        self._flush_touches()
             
-            cursor.execute("SELECT html_content FROM html_cache WHERE url = ?", (url,))
-            result = cursor.fetchone()
+            # A different URL under the same hash is a collision, treated as a miss
+            if result and result[1] == url:
+                logger.debug("Retrieved cached HTML for URL: %s", url)
+                return _decompress_html(result[0])
             
-            if result:
-                # Update last accessed timestamp
-                cursor.execute("""
-                    UPDATE html_cache SET last_accessed = CURRENT_TIMESTAMP WHERE url = ?
-                """, (url,))
-                
-                conn.commit()
-                conn.close()
-                
-                logger.debug(f"Retrieved cached HTML for URL: {url}")
-                return result[0]
-            
-            conn.close()
             return None
             
         except Exception as e:
             logger.error(f"Failed to retrieve cached HTML for {url}: {e}")
             return None
     
+    def get_validators(self, url: str) -> Optional[Tuple[Optional[str], Optional[str]]]:
+        """
+        Retrieve the HTTP validators stored with a cached page.
+        
+        Args:
+            url: URL to look up
+            
+        Returns:
+            (etag, last_modified) tuple, or None if the page is not cached or has neither
+        """
+        try:
+            with self._lock:
+                result = self._conn.execute(self._SQL_GET_VALIDATORS, (_url_hash(url),)).fetchone()
+            
+            if result and result[2] == url and (result[0] or result[1]):
+                return result[0], result[1]
+            return None
+            
+        except Exception as e:
+            logger.error(f"Failed to retrieve cache validators for {url}: {e}")
+            return None
+    
+    def mark_revalidated(self, url: str):
+        """
+        Record that the server confirmed a cached page is still current (HTTP 304).
+        
+        Args:
+            url: URL that was revalidated
+        """
+        try:
+            with self._lock:
+                self._conn.execute(self._SQL_REVALIDATED, (_url_hash(url),))
+        except Exception as e:
+            logger.error(f"Failed to mark {url} as revalidated: {e}")
+    
+    def _flush_touches(self):
+        """Write pending last accessed timestamps in one transaction. Caller holds the lock."""
+        if not self._pending_touches:
+            return
+        touches = [(url_hash,) for url_hash in self._pending_touches]
+        self._pending_touches.clear()
+        self._conn.execute("BEGIN")
+        try:
+            self._conn.executemany(self._SQL_TOUCH, touches)
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+    
     def clear_cache(self, older_than_days: int = None):
         """
         Clear HTML cache entries.
@@ -118,44 +313,50 @@ class CacheManager:
             older_than_days: Clear entries older than this many days (optional)
         """
         try:
-            conn = sqlite3.connect(str(self.cache_file))
-            cursor = conn.cursor()
-            
-            if older_than_days:
-                cursor.execute("""
-                    DELETE FROM html_cache 
-                    WHERE cached_at < datetime('now', '-{} days')
-                """.format(older_than_days))
-                logger.info(f"Cleared HTML cache entries older than {older_than_days} days")
-            else:
-                cursor.execute("DELETE FROM html_cache")
-                logger.info("Cleared all HTML cache entries")
-            
-            conn.commit()
-            conn.close()
+            with self._lock:
+                if older_than_days:
+                    # Same 'YYYY-MM-DD HH:MM:SS' UTC form as CURRENT_TIMESTAMP, bound so the delete range-scans the cached_at index
+                    cutoff = (datetime.now(timezone.utc) - timedelta(days=older_than_days)).strftime('%Y-%m-%d %H:%M:%S')
+                    self._conn.execute(self._SQL_DELETE_OLDER_THAN, (cutoff,))
+                    logger.info(f"Cleared HTML cache entries older than {older_than_days} days")
+                else:
+                    self._conn.execute("DELETE FROM html_cache")
+                    logger.info("Cleared all HTML cache entries")
                 
         except Exception as e:
             logger.error(f"Failed to clear HTML cache: {e}")
             raise
     
+    def optimize(self):
+        """Write pending access times, refresh query planner statistics and return free pages to the filesystem."""
+        try:
+            with self._lock:
+                self._flush_touches()
+                self._conn.execute("PRAGMA optimize")
+                self._conn.execute("PRAGMA incremental_vacuum").fetchall()  # Steps through every freed page
+        except Exception as e:
+            logger.error(f"Failed to optimize HTML cache: {e}")
+    
+    def close(self):
+        """Optimize and close the cache connection; registered to run at interpreter exit."""
+        if self._conn is None:
+            return
+        self.optimize()
+        with self._lock:
+            self._conn.close()
+            self._conn = None
+        atexit.unregister(self.close)
+    
     def get_cache_stats(self) -> Dict[str, Any]:
         """Get HTML cache statistics."""
         try:
-            conn = sqlite3.connect(str(self.cache_file))
-            cursor = conn.cursor()
-            
-            # Get total entries
-            cursor.execute("SELECT COUNT(*) FROM html_cache")
-            total_entries = cursor.fetchone()[0]
-            
-            # Get oldest and newest cache entries
-            cursor.execute("SELECT MIN(cached_at) FROM html_cache")
-            oldest = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT MAX(cached_at) FROM html_cache")
-            newest = cursor.fetchone()[0]
-            
-            conn.close()
+            with self._lock:
+                # Get total entries
+                total_entries = self._conn.execute("SELECT COUNT(*) FROM html_cache").fetchone()[0]
+                
+                # Get oldest and newest cache entries
+                oldest = self._conn.execute("SELECT MIN(cached_at) FROM html_cache").fetchone()[0]
+                newest = self._conn.execute("SELECT MAX(cached_at) FROM html_cache").fetchone()[0]
             
             return {
                 'pipeline_name': self.pipeline_name,
@@ -186,15 +387,31 @@ class CacheManager:
     def list_cached_urls(self) -> list:
         """List all cached URLs."""
         try:
-            conn = sqlite3.connect(str(self.cache_file))
-            cursor = conn.cursor()
-            
-            cursor.execute("SELECT url, cached_at FROM html_cache ORDER BY cached_at DESC")
-            results = cursor.fetchall()
-            
-            conn.close()
-            return results
+            with self._lock:
+                return self._conn.execute("SELECT url, cached_at FROM html_cache ORDER BY cached_at DESC").fetchall()
             
         except Exception as e:
             logger.error(f"Failed to list cached URLs: {e}")
             return []
+
+
+# Cache managers by pipeline name, shared by every scraper and parser in the process
+_cache_managers: Dict[str, CacheManager] = {}
+_cache_managers_lock = threading.Lock()
+
+
+def get_cache_manager(pipeline_name: str = "competition") -> CacheManager:
+    """
+    Get or create the cache manager shared by everything caching pages for a pipeline.
+    
+    Args:
+        pipeline_name: Name of the pipeline (e.g., 'competition', 'matches', etc.)
+    
+    Returns:
+        Shared CacheManager instance
+    """
+    with _cache_managers_lock:
+        cache_manager = _cache_managers.get(pipeline_name)
+        if cache_manager is None:
+            cache_manager = _cache_managers[pipeline_name] = CacheManager(pipeline_name)
+        return cache_manager
@@ -0,0 +1,39 @@
+from typing import Any, Optional
+import lxml.html
+
+
+def safe_int(value: Any) -> Optional[int]:
+    """
+    Convert a scraped value to an integer.
+
+    Strings are parsed, other values are returned unchanged; empty or unparseable
+    values become None.
+
+    Args:
+        value: Cell text or an already converted value
+
+    Returns:
+        The integer value, or None if there is none
+    """
+    if value == '' or value is None:
+        return None
+    try:
+        return int(value) if isinstance(value, str) else value
+    except ValueError:
+        return None
+
+
+def cell_text(element: lxml.html.HtmlElement) -> str:
+    """
+    Return the stripped text of an lxml element.
+
+    Matches BeautifulSoup's get_text(strip=True): each text node is stripped and the
+    pieces are joined without a separator.
+
+    Args:
+        element: Table cell or any other lxml element
+
+    Returns:
+        The concatenated text
+    """
+    return ''.join(text.strip() for text in element.itertext())
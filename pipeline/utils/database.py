@@ -1,74 +1,281 @@
+import atexit
 import duckdb
 import json
+import os
+import threading
+import pandas as pd
+from collections import defaultdict
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
 from pipeline.utils.logging import get_logger
 from pipeline.utils.query import DatabaseQueries
 from pipeline.utils.mapping import LEADER_TABLE_TYPE_MAPPING
+from pipeline.utils.convert import safe_int
 
 logger = get_logger()
 
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the standard json module
+    orjson = None
+
+
+# DuckDB settings applied when a database file is first opened; tuned for bulk loads.
+# preserve_insertion_order keeps its default, since reads without ORDER BY rely on it
+_DEFAULT_CONNECTION_CONFIG = {
+    'threads': os.cpu_count() or 1,
+}
+
+# One root connection per database file, shared by every DatabaseManager in the process, with the
+# number of open cursors on it; managers work on cursors duplicated from it instead of reopening the
+# file, and the root is closed (releasing the file lock) when its last cursor is closed
+_DB_HANDLES: Dict[Path, List[Any]] = {}
+_DB_HANDLES_LOCK = threading.Lock()
+
+
+def _open_cursor(db_path: Path, config: Dict[str, Any]) -> duckdb.DuckDBPyConnection:
+    """Return a new cursor on the root connection for a database file, opening the file with the given settings if needed."""
+    key = db_path.resolve()
+    with _DB_HANDLES_LOCK:
+        handle = _DB_HANDLES.get(key)
+        if handle is None:
+            handle = [duckdb.connect(str(db_path), config=config), 0]
+            _DB_HANDLES[key] = handle
+        cursor = handle[0].cursor()
+        handle[1] += 1
+        return cursor
+
+
+def _close_cursor(db_path: Path, cursor: duckdb.DuckDBPyConnection):
+    """Close a cursor from _open_cursor, closing the root connection once no cursor is left."""
+    key = db_path.resolve()
+    with _DB_HANDLES_LOCK:
+        cursor.close()
+        handle = _DB_HANDLES.get(key)
+        if handle is None:
+            return
+        handle[1] -= 1
+        if handle[1] <= 0:
+            handle[0].close()
+            del _DB_HANDLES[key]
+
+
+@atexit.register
+def _close_shared_connections():
+    """Close root connections still open at exit so DuckDB checkpoints its WAL."""
+    with _DB_HANDLES_LOCK:
+        for root, _ in _DB_HANDLES.values():
+            root.close()
+        _DB_HANDLES.clear()
+
+
+def _dumps_json(obj: Any) -> str:
+    """Serialize a value for a JSON column, keeping non-ASCII characters as-is."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _safe_numeric(value):
+    """Convert empty strings to None for float columns."""
+    if value == '' or value is None:
+        return None
+    try:
+        return float(value) if isinstance(value, str) else value
+    except (ValueError, TypeError):
+        return None
+
+
+def _coerce_int_column(values: List[Any]) -> List[Any]:
+    """Convert a whole integer column at once; empty or unparseable values become None."""
+    numbers = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce')
+    ints = numbers.where(numbers % 1 == 0).astype('Int64')
+    return ints.astype(object).where(ints.notna(), None).tolist()
+
+
+def _coerce_float_column(values: List[Any]) -> List[Any]:
+    """Convert a whole float column at once; empty or unparseable values become None."""
+    floats = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').astype('Float64')
+    return floats.astype(object).where(floats.notna(), None).tolist()
+
+
+# Player stats columns of the match table, in INSERT_MATCH_TABLE order
+_PLAYER_STATS_KEYS = (
+    'player_summary_stats',
+    'player_passing_stats',
+    'player_pass_types_stats',
+    'player_defense_stats',
+    'player_possession_stats',
+    'player_miscellaneous_stats',
+    'player_goalkeeper_stats',
+)
+
+# Positions of the numeric columns in a match row (see _build_match_row)
+_MATCH_ATTENDANCE_INDEX = 8
+_MATCH_HOME_XG_INDEX = 15
+_MATCH_AWAY_XG_INDEX = 16
+
+
+@lru_cache(maxsize=128)
+def _sql(template: str, **fields: str) -> str:
+    """Fill a DatabaseQueries template, caching the result since table and column names repeat."""
+    return template.format(**fields)
+
+
+def _join_top_scorer(top_scorer):
+    """Convert top_scorer list to string if needed."""
+    if isinstance(top_scorer, list):
+        return ', '.join(top_scorer)
+    return top_scorer
+
+
+def _build_domestic_season(season: Dict[str, Any], top_scorer: Optional[str]) -> Dict[str, Any]:
+    """Domestic league format."""
+    return {
+        'season': season.get('season'),
+        'season_link': season.get('season_link'),
+        'champion': season.get('champion'),
+        'points': season.get('points'),
+        'top_scorer': top_scorer,
+        'top_goals': season.get('top_goals'),
+        'num_squads': season.get('num_squads')
+    }
+
+
+def _build_club_tournament_season(season: Dict[str, Any], top_scorer: Optional[str]) -> Dict[str, Any]:
+    """Club tournament format."""
+    return {
+        'season': season.get('season'),
+        'season_link': season.get('season_link'),
+        'num_squads': season.get('num_squads'),
+        'champion': season.get('champion'),
+        'runner_up': season.get('runner_up'),
+        'top_scorer': top_scorer,
+        'top_scorer_goals': season.get('top_goals')
+    }
+
+
+def _build_nation_tournament_season(season: Dict[str, Any], top_scorer: Optional[str]) -> Dict[str, Any]:
+    """Nation tournament format."""
+    return {
+        'season': season.get('season'),
+        'season_link': season.get('season_link'),
+        'host_country': season.get('host_country'),
+        'num_squads': season.get('num_squads'),
+        'champion': season.get('champion'),
+        'runner_up': season.get('runner_up'),
+        'top_scorer': top_scorer,
+        'top_scorer_goals': season.get('top_goals')
+    }
+
+
+# Season table name -> (STRUCT array column, builder for one season entry)
+_SEASON_TABLE_LAYOUTS = {
+    "season": ("seasons", _build_domestic_season),
+    "season_club_tournament": ("club_tournaments", _build_club_tournament_season),
+    "season_nation_tournament": ("national_tournaments", _build_nation_tournament_season),
+}
+
+
 class DatabaseManager:
     """Manages DuckDB database operations for FBref competition data."""
     
-    def __init__(self, db_path: str = "database/fbref_database.db"):
+    def __init__(self, db_path: str = "database/fbref_database.db", config: Optional[Dict[str, Any]] = None):
         """
         Initialize database manager.
         
         Args:
             db_path: Path to the DuckDB database file
+            config: DuckDB settings (e.g. threads, memory_limit, temp_directory) overriding the
+                    bulk-load defaults; only used by the manager that opens the file
         """
         self.db_path = Path(db_path)
+        self.config = {**_DEFAULT_CONNECTION_CONFIG, **(config or {})}
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = None
+        self._conn = None
+        # Number of open `with` blocks; only the outermost one connects and disconnects
+        self._context_depth = 0
+        # Set while a _transaction() block is open, so nested blocks join the outer transaction
+        self._in_transaction = False
         
+    @property
+    def conn(self) -> duckdb.DuckDBPyConnection:
+        """Open connection to the database, connecting on first use."""
+        if self._conn is None:
+            self.connect()
+        return self._conn
+    
     def connect(self):
-        """Connect to the database."""
+        """Connect to the database through a cursor on the shared root connection."""
+        if self._conn is not None:
+            return
         try:
-            self.conn = duckdb.connect(str(self.db_path))
+            self._conn = _open_cursor(self.db_path, self.config)
             # Removed verbose connection logging
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
 
 
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Run the block's statements in one transaction, rolled back if the block raises."""
+        if self._in_transaction:
+            # Already inside a transaction; the outermost block commits
+            yield
+            return
+        
+        self.conn.execute("BEGIN TRANSACTION")
+        self._in_transaction = True
+        try:
+            yield
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        finally:
+            self._in_transaction = False
+
+
     ### CREATE TABLES ###
 
     
     def create_tables(self):
         """Create all competition tables."""
-        if not self.conn:
-            self.connect()
-        
-        # Consolidated Club Competitions table (Big 5, Domestic, International Cups)
-        self.conn.execute(DatabaseQueries.CREATE_COMPETITION_CLUB_TABLE)
+        # All tables are created in one transaction
+        with self._transaction():
+            # Consolidated Club Competitions table (Big 5, Domestic, International Cups)
+            self.conn.execute(DatabaseQueries.CREATE_COMPETITION_CLUB_TABLE)
         
-        # National Team Competitions table
-        self.conn.execute(DatabaseQueries.CREATE_COMPETITION_NATION_TABLE)
+            # National Team Competitions table
+            self.conn.execute(DatabaseQueries.CREATE_COMPETITION_NATION_TABLE)
         
-        # Season table (only for domestic leagues)
-        self.conn.execute(DatabaseQueries.CREATE_SEASON_TABLE)
+            # Season table (only for domestic leagues)
+            self.conn.execute(DatabaseQueries.CREATE_SEASON_TABLE)
         
-        # Tournament Club table (for club international cups like UEFA Champions League)
-        self.conn.execute(DatabaseQueries.CREATE_SEASON_CLUB_TOURNAMENT_TABLE)
+            # Tournament Club table (for club international cups like UEFA Champions League)
+            self.conn.execute(DatabaseQueries.CREATE_SEASON_CLUB_TOURNAMENT_TABLE)
         
-        # Tournament Nation table (for national tournaments like World Cup)
-        self.conn.execute(DatabaseQueries.CREATE_SEASON_NATION_TOURNAMENT_TABLE)
+            # Tournament Nation table (for national tournaments like World Cup)
+            self.conn.execute(DatabaseQueries.CREATE_SEASON_NATION_TOURNAMENT_TABLE)
         
-        # Score table (only for domestic leagues)
-        self.conn.execute(DatabaseQueries.CREATE_SCORE_TABLE)
+            # Score table (only for domestic leagues)
+            self.conn.execute(DatabaseQueries.CREATE_SCORE_TABLE)
 
-        # Tournament History Club table - club (e.g., UEFA Champions League)
-        self.conn.execute(DatabaseQueries.CREATE_SCORE_TABLE_CLUB_TOURNAMENT)
+            # Tournament History Club table - club (e.g., UEFA Champions League)
+            self.conn.execute(DatabaseQueries.CREATE_SCORE_TABLE_CLUB_TOURNAMENT)
 
-        # Tournament History Nation table - nation (e.g., World Cup)
-        self.conn.execute(DatabaseQueries.CREATE_SCORE_TABLE_NATION_TOURNAMENT)
+            # Tournament History Nation table - nation (e.g., World Cup)
+            self.conn.execute(DatabaseQueries.CREATE_SCORE_TABLE_NATION_TOURNAMENT)
 
-        # Fixture table - stores fixture data
-        self.conn.execute(DatabaseQueries.CREATE_FIXTURE_TABLE)
+            # Fixture table - stores fixture data
+            self.conn.execute(DatabaseQueries.CREATE_FIXTURE_TABLE)
         
-        # Match table - stores individual match report data
-        self.conn.execute(DatabaseQueries.CREATE_MATCH_TABLE)
+            # Match table - stores individual match report data
+            self.conn.execute(DatabaseQueries.CREATE_MATCH_TABLE)
 
 
     ### INSERT QUERIES ###
@@ -77,42 +284,48 @@ class DatabaseManager:
     def insert_competitions(self, table_name: str, competitions: List[Dict[str, Any]]):
         """
         Insert competition data into specified table.
-        Clears existing data before inserting new data to avoid duplicates.
+        Existing rows are replaced by competition_id, and competitions missing from the list are removed.
         
         Args:
             table_name: Name of the table to insert into
             competitions: List of competition dictionaries
         """
-        if not self.conn:
-            self.connect()
-        
         if not competitions:
             logger.warning(f"No competitions to insert into {table_name}")
             return
         
+        # Convert awards to JSON string for DuckDB STRUCT array
+        for comp in competitions:
+            if 'awards' in comp and comp['awards']:
+                comp['awards'] = json.dumps(comp['awards'])
+            else:
+                comp['awards'] = json.dumps([])
+        
+        # Column-wise frame with one column order for every row; keys missing from a competition are inserted as NULL.
+        # object dtype keeps None as NULL instead of letting pandas turn integer columns into floats.
+        columns = list(dict.fromkeys(key for comp in competitions for key in comp))
+        frame = pd.DataFrame({
+            column: pd.Series([comp.get(column) for comp in competitions], dtype=object)
+            for column in columns
+        })
+        view_name = f"{table_name}_staging"
+        query = _sql(
+            DatabaseQueries.UPSERT_COMPETITIONS_FROM_VIEW,
+            table_name=table_name, 
+            columns=', '.join(columns), 
+            view_name=view_name
+        )
+        
         try:
-            # Clear existing data to avoid duplicates
-            self.conn.execute(DatabaseQueries.DELETE_COMPETITIONS.format(table_name=table_name))
-            
-            # Convert awards to JSON string for DuckDB STRUCT array
-            for comp in competitions:
-                if 'awards' in comp and comp['awards']:
-                    comp['awards'] = json.dumps(comp['awards'])
-                else:
-                    comp['awards'] = json.dumps([])
-            
-            # Insert competitions
-            for comp in competitions:
-                placeholders = ', '.join(['?' for _ in comp])
-                columns = ', '.join(comp.keys())
-                values = list(comp.values())
-                
-                query = DatabaseQueries.INSERT_COMPETITIONS.format(
-                    table_name=table_name, 
-                    columns=columns, 
-                    placeholders=placeholders
-                )
-                self.conn.execute(query, values)
+            with self._transaction():
+                self.conn.register(view_name, frame)
+                try:
+                    # Upsert competitions in one set-based statement scanning the frame, rewriting existing rows in place
+                    self.conn.execute(query)
+                    # Competitions no longer listed are removed, so the table still mirrors the scraped list
+                    self.conn.execute(_sql(DatabaseQueries.DELETE_COMPETITIONS_NOT_IN_VIEW, table_name=table_name, view_name=view_name))
+                finally:
+                    self.conn.unregister(view_name)
             
         except Exception as e:
             logger.error(f"Failed to insert competitions into {table_name}: {e}")
@@ -121,7 +334,7 @@ class DatabaseManager:
     def insert_seasons(self, competition_name: str, competition_id: int, seasons: List[Dict[str, Any]], table_name: str = "season"):
         """
         Insert season data for a competition into the specified table.
-        Clears existing data for this competition before inserting new data.
+        Replaces existing data for this competition.
         
         Args:
             competition_name: Name of the competition
@@ -129,79 +342,28 @@ class DatabaseManager:
             seasons: List of season data dictionaries
             table_name: Table to insert into ("season", "season_club_tournament", or "season_nation_tournament")
         """
-        if not self.conn:
-            self.connect()
-        
         try:
-            # Clear existing data for this competition
-            self.conn.execute(
-                DatabaseQueries.DELETE_SEASONS.format(table_name=table_name), 
-                (competition_id,)
-            )
-            
-            if not seasons:
-                logger.info(f"No seasons to insert for {competition_name}")
-                return
-            
-            # Convert seasons to DuckDB STRUCT format based on table type
-            seasons_struct = []
-            for season in seasons:
-                # Convert top_scorer list to string if needed
-                top_scorer = season.get('top_scorer')
-                if isinstance(top_scorer, list):
-                    top_scorer = ', '.join(top_scorer)
+            with self._transaction():
+                if not seasons:
+                    # Nothing to replace the existing row with, so just clear it
+                    self.conn.execute(
+                        _sql(DatabaseQueries.DELETE_SEASONS, table_name=table_name), 
+                        (competition_id,)
+                    )
+                    logger.info(f"No seasons to insert for {competition_name}")
+                    return
                 
-                if table_name == "season":
-                    # Domestic league format
-                    seasons_struct.append({
-                        'season': season.get('season'),
-                        'season_link': season.get('season_link'),
-                        'champion': season.get('champion'),
-                        'points': season.get('points'),
-                        'top_scorer': top_scorer,
-                        'top_goals': season.get('top_goals'),
-                        'num_squads': season.get('num_squads')
-                    })
-                elif table_name == "season_club_tournament":
-                    # Club tournament format
-                    seasons_struct.append({
-                        'season': season.get('season'),
-                        'season_link': season.get('season_link'),
-                        'num_squads': season.get('num_squads'),
-                        'champion': season.get('champion'),
-                        'runner_up': season.get('runner_up'),
-                        'top_scorer': top_scorer,
-                        'top_scorer_goals': season.get('top_goals')
-                    })
-                elif table_name == "season_nation_tournament":
-                    # Nation tournament format
-                    seasons_struct.append({
-                        'season': season.get('season'),
-                        'season_link': season.get('season_link'),
-                        'host_country': season.get('host_country'),
-                        'num_squads': season.get('num_squads'),
-                        'champion': season.get('champion'),
-                        'runner_up': season.get('runner_up'),
-                        'top_scorer': top_scorer,
-                        'top_scorer_goals': season.get('top_goals')
-                    })
-            
-            # Determine the correct column name for the STRUCT array
-            if table_name == "season":
-                struct_column = "seasons"
-            elif table_name == "season_club_tournament":
-                struct_column = "club_tournaments"
-            elif table_name == "season_nation_tournament":
-                struct_column = "national_tournaments"
-            else:
-                struct_column = "seasons"  # fallback
-            
-            # Insert season data
-            query = DatabaseQueries.INSERT_SEASONS.format(
-                table_name=table_name, 
-                struct_column=struct_column
-            )
-            self.conn.execute(query, (competition_name, competition_id, seasons_struct))
+                # Convert seasons to DuckDB STRUCT format based on table type
+                seasons_struct = self._build_seasons_struct(seasons, table_name)
+                struct_column = self._season_struct_column(table_name)
+                
+                # Insert season data, replacing the competition's existing row in the same pass
+                query = _sql(
+                    DatabaseQueries.INSERT_SEASONS,
+                    table_name=table_name, 
+                    struct_column=struct_column
+                )
+                self.conn.execute(query, (competition_name, competition_id, seasons_struct))
             
             # Seasons inserted silently
             
@@ -209,10 +371,62 @@ class DatabaseManager:
             logger.error(f"Failed to insert seasons for {competition_name} into {table_name}: {e}")
             raise
     
+    def _build_seasons_struct(self, seasons: List[Dict[str, Any]], table_name: str) -> List[Dict[str, Any]]:
+        """
+        Convert scraped seasons to the DuckDB STRUCT layout of the given season table.
+        
+        Args:
+            seasons: List of season data dictionaries
+            table_name: Target season table name
+            
+        Returns:
+            List of STRUCT-ready season dictionaries
+        """
+        layout = _SEASON_TABLE_LAYOUTS.get(table_name)
+        if layout is None:
+            return []
+        
+        # Pick the table's builder once instead of branching per season
+        build = layout[1]
+        return [build(season, _join_top_scorer(season.get('top_scorer'))) for season in seasons]
+    
+    def _season_struct_column(self, table_name: str) -> str:
+        """Return the STRUCT array column name of the given season table."""
+        layout = _SEASON_TABLE_LAYOUTS.get(table_name)
+        return layout[0] if layout else "seasons"  # fallback
+    
+    def insert_seasons_bulk(self, rows: List[Tuple[str, int, List[Dict[str, Any]]]], table_name: str = "season"):
+        """
+        Replace season data for many competitions of one table in a single transaction.
+        
+        Args:
+            rows: List of (competition_name, competition_id, seasons) tuples
+            table_name: Table to insert into ("season", "season_club_tournament", or "season_nation_tournament")
+        """
+        if not rows:
+            return
+        
+        struct_column = self._season_struct_column(table_name)
+        params = [
+            (competition_name, competition_id, self._build_seasons_struct(seasons, table_name))
+            for competition_name, competition_id, seasons in rows
+        ]
+        
+        try:
+            with self._transaction():
+                # INSERT OR REPLACE overwrites each competition's existing row, no DELETE pass needed
+                self.conn.executemany(
+                    _sql(DatabaseQueries.INSERT_SEASONS, table_name=table_name, struct_column=struct_column),
+                    params
+                )
+        except Exception as e:
+            logger.error(f"Failed to bulk insert {len(rows)} competitions into {table_name}: {e}")
+            raise
+    
     def insert_score_tables(self, competition_name: str, competition_id: int, score_tables_by_season: Dict[str, List[Dict[str, Any]]]):
         """
         Insert score table data for a competition organized by season (DOMESTIC LEAGUES ONLY).
-        Clears existing data for this competition before inserting new data.
+        Replaces existing data for this competition.
         
         Args:
             competition_name: Name of the competition
@@ -220,33 +434,19 @@ class DatabaseManager:
             score_tables_by_season: Dictionary with season as key and list of team records as value
                                    e.g., {"2024-2025": [{rank: 1, team: "Liverpool", ...}, ...]}
         """
-        if not self.conn:
-            self.connect()
-        
         try:
-            # Clear existing data for this competition
-            self.conn.execute(DatabaseQueries.DELETE_SCORE_TABLES, (competition_id,))
-            
-            if not score_tables_by_season:
-                logger.info(f"No score table data to insert for {competition_name}")
-                return
-            
-            # Convert score tables to STRUCT array format with JSON
-            import json
-            score_tables_struct = []
-            
-            for season, score_table_data in score_tables_by_season.items():
-                # Use ensure_ascii=False to preserve non-ASCII characters (e.g., accents)
-                score_table_json = json.dumps(score_table_data, ensure_ascii=False) if score_table_data else None
+            with self._transaction():
+                if not score_tables_by_season:
+                    # Nothing to replace the existing row with, so just clear it
+                    self.conn.execute(DatabaseQueries.DELETE_SCORE_TABLES, (competition_id,))
+                    logger.info(f"No score table data to insert for {competition_name}")
+                    return
                 
-                score_tables_struct.append({
-                    'season': season,
-                    'score_table': score_table_json,
-                    
-                })
-            
-            # Insert score table data
-            self.conn.execute(DatabaseQueries.INSERT_SCORE_TABLES, (competition_name, competition_id, score_tables_struct))
+                # Convert score tables to STRUCT array format with JSON
+                score_tables_struct = self._build_score_tables_struct(score_tables_by_season)
+                
+                # Insert score table data
+                self.conn.execute(DatabaseQueries.INSERT_SCORE_TABLES, (competition_name, competition_id, score_tables_struct))
             
             # Score tables inserted silently
             
@@ -259,32 +459,70 @@ class DatabaseManager:
         Insert tournament league table data (club or nation) organized by season into the specified table.
         The table should be either 'tournament_score_table_club' or 'tournament_score_table_nation'.
         """
-        if not self.conn:
-            self.connect()
-        
         try:
-            self.conn.execute(
-                DatabaseQueries.DELETE_TOURNAMENT_SCORE_TABLES.format(table_name=table_name),
-                (competition_id,)
-            )
-            if not score_tables_by_season:
-                logger.info(f"No tournament score table data to insert for {competition_name}")
-                return
-            import json
-            score_tables_struct = []
-            for season, score_table_data in score_tables_by_season.items():
-                # Preserve unicode characters in JSON
-                score_table_json = json.dumps(score_table_data, ensure_ascii=False) if score_table_data else None
-                score_tables_struct.append({
-                    'season': season,
-                    'score_table': score_table_json
-                })
-            query = DatabaseQueries.INSERT_TOURNAMENT_SCORE_TABLE.format(table_name=table_name)
-            self.conn.execute(query, (competition_name, competition_id, score_tables_struct))
+            with self._transaction():
+                if not score_tables_by_season:
+                    # Nothing to replace the existing row with, so just clear it
+                    self.conn.execute(
+                        _sql(DatabaseQueries.DELETE_TOURNAMENT_SCORE_TABLES, table_name=table_name),
+                        (competition_id,)
+                    )
+                    logger.info(f"No tournament score table data to insert for {competition_name}")
+                    return
+                score_tables_struct = self._build_score_tables_struct(score_tables_by_season)
+                query = _sql(DatabaseQueries.INSERT_TOURNAMENT_SCORE_TABLE, table_name=table_name)
+                self.conn.execute(query, (competition_name, competition_id, score_tables_struct))
         except Exception as e:
             logger.error(f"Failed to insert tournament score tables for {competition_name} into {table_name}: {e}")
             raise
 
+    def _build_score_tables_struct(self, score_tables_by_season: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Convert score tables keyed by season to the STRUCT array layout with JSON tables.
+        
+        Args:
+            score_tables_by_season: Dictionary with season as key and list of team records as value
+            
+        Returns:
+            List of STRUCT-ready season dictionaries
+        """
+        return [
+            {
+                'season': season,
+                # Use ensure_ascii=False to preserve non-ASCII characters (e.g., accents)
+                'score_table': _dumps_json(score_table_data) if score_table_data else None
+            }
+            for season, score_table_data in score_tables_by_season.items()
+        ]
+    
+    def insert_score_tables_bulk(self, rows: List[Tuple[str, int, Dict[str, List[Dict[str, Any]]]]], table_name: str = "score_table"):
+        """
+        Replace score table data for many competitions in a single transaction.
+        
+        Args:
+            rows: List of (competition_name, competition_id, score_tables_by_season) tuples
+            table_name: Table to insert into ("score_table", "score_table_club_tournament", or "score_table_nation_tournament")
+        """
+        if not rows:
+            return
+        
+        params = [
+            (competition_name, competition_id, self._build_score_tables_struct(score_tables_by_season))
+            for competition_name, competition_id, score_tables_by_season in rows
+        ]
+        
+        # The tournament score table templates take the table name, so they serve score_table too
+        try:
+            with self._transaction():
+                # INSERT OR REPLACE overwrites each competition's existing row, no DELETE pass needed
+                self.conn.executemany(
+                    _sql(DatabaseQueries.INSERT_TOURNAMENT_SCORE_TABLE, table_name=table_name),
+                    params
+                )
+        except Exception as e:
+            logger.error(f"Failed to bulk insert {len(rows)} competitions into {table_name}: {e}")
+            raise
+
     def insert_fixtures(self, competition_name: str, competition_id: int, fixtures_by_season: Dict[str, List[Dict[str, Any]]]):
         """
         Insert fixture data for a competition organized by season.
@@ -296,9 +534,6 @@ class DatabaseManager:
             fixtures_by_season: Dictionary with season as key and list of fixture records as value
                                    e.g., {"2024-2025": [{week: 1, day: "Thursday", date: "2024-08-15", ...}, ...]}
         """
-        if not self.conn:
-            self.connect()
-        
         try:
             # Clear existing data for this competition
             #self.conn.execute(DatabaseQueries.DELETE_FIXTURE_TABLES.format(table_name='fixture'), (competition_id,))
@@ -307,36 +542,10 @@ class DatabaseManager:
                 logger.info(f"No fixture data to insert for {competition_name}")
                 return
             
-            import json
-            fixtures_struct = []
-
-            for season, fixture_data in fixtures_by_season.items():
-                if fixture_data:
-                    # Group fixtures by (round, week). Using round ensures knockout stages are separated
-                    fixtures_by_group = {}
-                    for fixture in fixture_data:
-                        round_value = fixture.get('round')
-                        week = fixture.get('week')
-                        key = (round_value, week)
-                        if key not in fixtures_by_group:
-                            fixtures_by_group[key] = {}
-
-                        # Create game key (e.g., "game1", "game2", etc.)
-                        game_num = len(fixtures_by_group[key]) + 1
-                        game_key = f"game{game_num}"
-                        fixtures_by_group[key][game_key] = fixture
-
-                    # Create fixtures structure entries for each (round, week) group
-                    for (round_value, week), grouped_fixtures in fixtures_by_group.items():
-                        fixtures_struct.append({
-                            'season': season,
-                            'round': round_value if round_value is not None else competition_name,
-                            'week': week,
-                            'scores_and_fixture': json.dumps(grouped_fixtures, ensure_ascii=False)
-                        })
+            fixtures_struct = self._build_fixtures_struct(competition_name, fixtures_by_season)
             
             # Insert fixture data
-            query = DatabaseQueries.INSERT_FIXTURE_TABLE.format(table_name='fixture')
+            query = DatabaseQueries.INSERT_FIXTURE_TABLE
             self.conn.execute(query, (competition_name, competition_id, fixtures_struct))
             
             logger.info(f"✓ Inserted fixtures for {competition_name}")
@@ -345,6 +554,138 @@ class DatabaseManager:
             logger.error(f"Failed to insert fixtures for {competition_name}: {e}")
             raise
 
+    def _build_fixtures_struct(self, competition_name: str, fixtures_by_season: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Convert fixtures keyed by season to the STRUCT array layout, one entry per (round, week) group.
+        
+        Args:
+            competition_name: Name of the competition, used as the round of fixtures without one
+            fixtures_by_season: Dictionary with season as key and list of fixture records as value
+            
+        Returns:
+            List of STRUCT-ready fixture group dictionaries
+        """
+        # (season, round, week) of each group, and the fixtures it holds
+        group_keys = []
+        group_payloads = []
+
+        for season, fixture_data in fixtures_by_season.items():
+            if fixture_data:
+                # Group fixtures by (round, week). Using round ensures knockout stages are separated
+                fixtures_by_group = defaultdict(dict)
+                games_per_group = defaultdict(int)
+                for fixture in fixture_data:
+                    key = (fixture.get('round'), fixture.get('week'))
+
+                    # Create game key (e.g., "game1", "game2", etc.)
+                    games_per_group[key] += 1
+                    fixtures_by_group[key][f"game{games_per_group[key]}"] = fixture
+
+                for (round_value, week), grouped_fixtures in fixtures_by_group.items():
+                    group_keys.append((season, round_value if round_value is not None else competition_name, week))
+                    group_payloads.append(grouped_fixtures)
+
+        # Encode every group in one pass, then pair the JSON back with its (season, round, week)
+        return [
+            {'season': season, 'round': round_value, 'week': week, 'scores_and_fixture': payload_json}
+            for (season, round_value, week), payload_json in zip(group_keys, map(_dumps_json, group_payloads))
+        ]
+    
+    def insert_fixtures_bulk(self, rows: List[Tuple[str, int, Dict[str, List[Dict[str, Any]]]]]):
+        """
+        Replace fixture data for many competitions in a single transaction.
+        
+        Args:
+            rows: List of (competition_name, competition_id, fixtures_by_season) tuples
+        """
+        if not rows:
+            return
+        
+        params = [
+            (competition_name, competition_id, self._build_fixtures_struct(competition_name, fixtures_by_season))
+            for competition_name, competition_id, fixtures_by_season in rows
+        ]
+        
+        try:
+            with self._transaction():
+                self.conn.executemany(DatabaseQueries.INSERT_FIXTURE_TABLE, params)
+        except Exception as e:
+            logger.error(f"Failed to bulk insert fixtures for {len(rows)} competitions: {e}")
+            raise
+
+    def _build_match_row(self, match_data: Dict[str, Any], coerce_numbers: bool = True) -> Tuple[Any, ...]:
+        """
+        Build the INSERT_MATCH_TABLE parameters for one match.
+        
+        Args:
+            match_data: Dictionary containing match information
+            coerce_numbers: Convert attendance and xG here; batch callers pass False and
+                            convert those columns for all rows at once
+            
+        Returns:
+            Tuple of values in match table column order
+        """
+        get = match_data.get
+        
+        # Prepare lineup data
+        lineup_data = get('lineup', {})
+        lineup_struct = {
+            'start': _dumps_json(lineup_data.get('start', {})),
+            'bench': _dumps_json(lineup_data.get('bench', {}))
+        }
+        
+        # Prepare match summary data
+        match_summary_json = _dumps_json(get('match_summary', {}))
+        
+        # Prepare team stats data
+        team_stats_data = get('team_stats', {})
+        team_stats_struct = {
+            'home_team': _dumps_json(team_stats_data.get('home_team', {})),
+            'away_team': _dumps_json(team_stats_data.get('away_team', {}))
+        }
+        
+        # Prepare player stats data, one struct per player stats column
+        player_stats_structs = []
+        for stats_key in _PLAYER_STATS_KEYS:
+            stats_data = get(stats_key, {})
+            player_stats_structs.append({
+                'home_team': _dumps_json(stats_data.get('home_team', [])),
+                'away_team': _dumps_json(stats_data.get('away_team', []))
+            })
+        
+        attendance = get('attendance')
+        home_team_xg = get('home_team_xg')
+        away_team_xg = get('away_team_xg')
+        if coerce_numbers:
+            attendance = safe_int(attendance)
+            home_team_xg = _safe_numeric(home_team_xg)
+            away_team_xg = _safe_numeric(away_team_xg)
+        
+        return (
+            get('match_id', ''),
+            get('match_link', ''),
+            get('competition_name', ''),
+            get('competition_id'),
+            get('season', ''),
+            get('week', ''),
+            get('date', ''),
+            get('time', ''),
+            attendance,
+            get('venue', ''),
+            get('referee', ''),
+            get('home_team', ''),
+            get('home_team_id', ''),
+            get('away_team', ''),
+            get('away_team_id', ''),
+            home_team_xg,
+            away_team_xg,
+            get('score', ''),
+            lineup_struct,
+            match_summary_json,
+            team_stats_struct,
+            *player_stats_structs
+        )
+    
     def insert_match(self, match_data: Dict[str, Any]) -> None:
         """
         Insert match data into the match table.
@@ -352,110 +693,85 @@ class DatabaseManager:
         Args:
             match_data: Dictionary containing match information
         """
-        if not self.conn:
-            self.connect()
-        
         try:
-            import json
-            
-            # Prepare lineup data
-            lineup_data = match_data.get('lineup', {})
-            lineup_struct = {
-                'start': json.dumps(lineup_data.get('start', {}), ensure_ascii=False),
-                'bench': json.dumps(lineup_data.get('bench', {}), ensure_ascii=False)
-            }
-            
-            # Prepare match summary data
-            match_summary_json = json.dumps(match_data.get('match_summary', {}), ensure_ascii=False)
-            
-            # Prepare team stats data
-            team_stats_data = match_data.get('team_stats', {})
-            team_stats_struct = {
-                'home_team': json.dumps(team_stats_data.get('home_team', {}), ensure_ascii=False),
-                'away_team': json.dumps(team_stats_data.get('away_team', {}), ensure_ascii=False)
-            }
-            
-            # Prepare player stats data
-            def prepare_player_stats_struct(stats_key: str) -> Dict[str, str]:
-                """Helper function to prepare player stats struct."""
-                stats_data = match_data.get(stats_key, {})
-                return {
-                    'home_team': json.dumps(stats_data.get('home_team', []), ensure_ascii=False),
-                    'away_team': json.dumps(stats_data.get('away_team', []), ensure_ascii=False)
-                }
-            
-            player_summary_stats_struct = prepare_player_stats_struct('player_summary_stats')
-            player_passing_stats_struct = prepare_player_stats_struct('player_passing_stats')
-            player_pass_types_stats_struct = prepare_player_stats_struct('player_pass_types_stats')
-            player_defense_stats_struct = prepare_player_stats_struct('player_defense_stats')
-            player_possession_stats_struct = prepare_player_stats_struct('player_possession_stats')
-            player_miscellaneous_stats_struct = prepare_player_stats_struct('player_miscellaneous_stats')
-            player_goalkeeper_stats_struct = prepare_player_stats_struct('player_goalkeeper_stats')
+            # Insert match data
+            self.conn.execute(DatabaseQueries.INSERT_MATCH_TABLE, self._build_match_row(match_data))
             
-            # Helper function to convert empty strings to None for numeric fields
-            def safe_numeric(value):
-                if value == '' or value is None:
-                    return None
-                try:
-                    return float(value) if isinstance(value, str) else value
-                except (ValueError, TypeError):
-                    return None
+            logger.debug("Inserted match: %s vs %s", match_data.get('home_team'), match_data.get('away_team'))
             
-            def safe_int(value):
-                if value == '' or value is None:
-                    return None
-                try:
-                    return int(value) if isinstance(value, str) else value
-                except (ValueError, TypeError):
-                    return None
+        except Exception as e:
+            logger.error(f"Failed to insert match {match_data.get('match_id')}: {e}")
+            raise
+    
+    def _build_match_rows(self, matches: List[Dict[str, Any]]) -> List[List[Any]]:
+        """
+        Build the INSERT_MATCH_TABLE parameters for many matches, converting numeric columns per batch.
+        
+        Args:
+            matches: List of dictionaries containing match information
             
-            # Insert match data
-            self.conn.execute(DatabaseQueries.INSERT_MATCH_TABLE, (
-                match_data.get('match_id', ''),
-                match_data.get('match_link', ''),
-                match_data.get('competition_name', ''),
-                match_data.get('competition_id'),
-                match_data.get('season', ''),
-                match_data.get('week', ''),
-                match_data.get('date', ''),
-                match_data.get('time', ''),
-                safe_int(match_data.get('attendance')),
-                match_data.get('venue', ''),
-                match_data.get('referee', ''),
-                match_data.get('home_team', ''),
-                match_data.get('home_team_id', ''),
-                match_data.get('away_team', ''),
-                match_data.get('away_team_id', ''),
-                safe_numeric(match_data.get('home_team_xg')),
-                safe_numeric(match_data.get('away_team_xg')),
-                match_data.get('score', ''),
-                lineup_struct,
-                match_summary_json,
-                team_stats_struct,
-                player_summary_stats_struct,
-                player_passing_stats_struct,
-                player_pass_types_stats_struct,
-                player_defense_stats_struct,
-                player_possession_stats_struct,
-                player_miscellaneous_stats_struct,
-                player_goalkeeper_stats_struct
-            ))
+        Returns:
+            List of rows in match table column order
+        """
+        rows = [list(self._build_match_row(match_data, coerce_numbers=False)) for match_data in matches]
+        
+        # Convert the numeric columns for the whole batch at once
+        for index, coerce in (
+            (_MATCH_ATTENDANCE_INDEX, _coerce_int_column),
+            (_MATCH_HOME_XG_INDEX, _coerce_float_column),
+            (_MATCH_AWAY_XG_INDEX, _coerce_float_column),
+        ):
+            for row, value in zip(rows, coerce([row[index] for row in rows])):
+                row[index] = value
+        
+        return rows
+    
+    def insert_matches(self, matches: List[Dict[str, Any]], chunk_size: int = 1000) -> None:
+        """
+        Insert many matches into the match table in a single transaction.
+        
+        Args:
+            matches: List of dictionaries containing match information
+            chunk_size: Number of matches JSON-encoded and sent per executemany, bounding memory use
+        """
+        if not matches:
+            return
+        
+        try:
+            with self._transaction():
+                for start in range(0, len(matches), chunk_size):
+                    rows = self._build_match_rows(matches[start:start + chunk_size])
+                    self.conn.executemany(DatabaseQueries.INSERT_MATCH_TABLE, rows)
             
-            logger.debug(f"Inserted match: {match_data.get('home_team')} vs {match_data.get('away_team')}")
+            logger.debug("Inserted %s matches", len(matches))
             
         except Exception as e:
-            logger.error(f"Failed to insert match {match_data.get('match_id')}: {e}")
+            logger.error(f"Failed to bulk insert {len(matches)} matches: {e}")
             raise
 
 
     ### GET QUERIES ###
 
     
+    def _fetch_records(self, query: str, params: Tuple = ()) -> List[Dict[str, Any]]:
+        """
+        Run a query and return its rows as dictionaries keyed by the result column names.
+        
+        Args:
+            query: SQL query to run
+            params: Query parameters
+            
+        Returns:
+            List of row dictionaries
+        """
+        cursor = self.conn.execute(query, params)
+        columns = [desc[0] for desc in cursor.description]
+        rows = cursor.fetchall()
+        # Map zip over the rows so the per-row work stays in C
+        return list(map(dict, map(zip, repeat(columns), rows)))
+    
     def get_seasons(self, competition_id: int) -> List[Dict[str, Any]]:
         """Get all seasons for a specific competition."""
-        if not self.conn:
-            self.connect()
-        
         try:
             result = self.conn.execute(DatabaseQueries.GET_SEASONS, (competition_id,)).fetchone()
             
@@ -466,19 +782,36 @@ class DatabaseManager:
             logger.error(f"Failed to get seasons for competition {competition_id}: {e}")
             return []
     
+    def get_all_domestic_seasons(self) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Get the seasons of every domestic competition in a single query.
+        
+        Returns:
+            Dictionary with competition ID as key and its list of seasons as value
+        """
+        try:
+            rows = self.conn.execute(DatabaseQueries.GET_ALL_DOMESTIC_SEASONS).fetchall()
+            return {competition_id: seasons for competition_id, seasons in rows if seasons}
+        except Exception as e:
+            logger.error(f"Failed to get domestic seasons: {e}")
+            return {}
+    
     def get_competitions(self, table_name: str) -> List[Dict[str, Any]]:
         """Get all competitions from a table."""
-        if not self.conn:
-            self.connect()
-        
         try:
-            result = self.conn.execute(DatabaseQueries.GET_COMPETITIONS.format(table_name=table_name)).fetchall()
-            columns = [desc[0] for desc in self.conn.description]
-            return [dict(zip(columns, row)) for row in result]
+            return self._fetch_records(_sql(DatabaseQueries.GET_COMPETITIONS, table_name=table_name))
         except Exception as e:
             logger.error(f"Failed to get competitions from {table_name}: {e}")
             return []
 
+    def get_competition_summaries(self, table_name: str) -> List[Dict[str, Any]]:
+        """Get the name, ID and type of every competition in a table, without the awards column."""
+        try:
+            return self._fetch_records(_sql(DatabaseQueries.GET_COMPETITION_SUMMARIES, table_name=table_name))
+        except Exception as e:
+            logger.error(f"Failed to get competition summaries from {table_name}: {e}")
+            return []
+
     def get_competition_type(self, competition_id: int) -> str:
         """
         Get the competition type for a given competition ID.
@@ -489,24 +822,12 @@ class DatabaseManager:
         Returns:
             'national' if it's a national competition, 'international' if it's an international club competition, 'domestic' otherwise
         """
-        if not self.conn:
-            self.connect()
-        
         try:
-            # Check if it's a national competition
-            nation_result = self.conn.execute(DatabaseQueries.GET_COMPETITION_TYPE_NATION, (competition_id,)).fetchone()
-            
-            if nation_result[0] > 0:
-                return 'national'
-            
-            # Check if it's an international club competition
-            club_result = self.conn.execute(DatabaseQueries.GET_COMPETITION_TYPE_CLUB, (competition_id,)).fetchone()
-            
-            if club_result and club_result[0] == 'international':
-                return 'international'
-            
-            # Default to domestic
-            return 'domestic'
+            # National, international club or domestic, decided by the database in one query
+            result = self.conn.execute(
+                DatabaseQueries.GET_COMPETITION_TYPE_COMBINED, (competition_id, competition_id)
+            ).fetchone()
+            return result[0]
             
         except Exception as e:
             logger.error(f"Failed to get competition type for {competition_id}: {e}")
@@ -514,8 +835,6 @@ class DatabaseManager:
 
     def get_club_tournament_seasons(self, competition_id: int) -> List[Dict[str, Any]]:
         """Get all seasons for a specific club tournament competition."""
-        if not self.conn:
-            self.connect()
         try:
             rows = self.conn.execute(DatabaseQueries.GET_CLUB_TOURNAMENT_SEASONS, (competition_id,)).fetchall()
             return [{'season': r[0], 'season_link': r[1]} for r in rows]
@@ -525,8 +844,6 @@ class DatabaseManager:
 
     def get_nation_tournament_seasons(self, competition_id: int) -> List[Dict[str, Any]]:
         """Get all seasons for a specific nation tournament competition."""
-        if not self.conn:
-            self.connect()
         try:
             rows = self.conn.execute(DatabaseQueries.GET_NATION_TOURNAMENT_SEASONS, (competition_id,)).fetchall()
             return [{'season': r[0], 'season_link': r[1]} for r in rows]
@@ -541,39 +858,23 @@ class DatabaseManager:
         Returns:
             List of dictionaries containing competition metadata and raw JSON score table data
         """
-        if not self.conn:
-            self.connect()
-        
         try:
             # Simple query to get raw score table data
-            result = self.conn.execute(DatabaseQueries.GET_SCORE_TABLES).fetchall()
-            columns = ['competition_name', 'competition_id', 'season', 'team_data_json']
-            
-            raw_data = []
-            for row in result:
-                raw_data.append(dict(zip(columns, row)))
-            
-            return raw_data
+            # (competition_name, competition_id, season, team_data_json)
+            return self._fetch_records(DatabaseQueries.GET_SCORE_TABLES)
             
         except Exception as e:
             logger.error(f"Failed to extract score table data: {e}")
             return []
 
-    def get_fixtures(self) -> List[Dict[str, Any]]:
-        """Get all fixture data from the database."""
-        if not self.conn:
-            self.connect()
-        
+    def get_fixtures(self, competition_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get fixture data from the database, for every competition or only the given one."""
         try:
             # Query to get fixture data with proper column names
-            result = self.conn.execute(DatabaseQueries.GET_FIXTURES).fetchall()
-            columns = ['competition_name', 'competition_id', 'fixtures']
-            
-            fixture_data = []
-            for row in result:
-                fixture_data.append(dict(zip(columns, row)))
-            
-            return fixture_data
+            # (competition_name, competition_id, fixtures)
+            if competition_id is not None:
+                return self._fetch_records(DatabaseQueries.GET_FIXTURES_BY_COMPETITION, (competition_id,))
+            return self._fetch_records(DatabaseQueries.GET_FIXTURES)
             
         except Exception as e:
             logger.error(f"Failed to extract fixture data: {e}")
@@ -581,23 +882,25 @@ class DatabaseManager:
 
     def get_table_count(self, table_name: str) -> int:
         """Get the number of records in a table."""
-        if not self.conn:
-            self.connect()
-        
-        result = self.conn.execute(DatabaseQueries.GET_TABLE_COUNT.format(table_name=table_name)).fetchone()
+        result = self.conn.execute(_sql(DatabaseQueries.GET_TABLE_COUNT, table_name=table_name)).fetchone()
         return result[0] if result else 0
     
     def __enter__(self):
-        """Context manager entry."""
-        self.connect()
+        """Context manager entry. Nested blocks reuse the connection opened by the outermost one."""
+        if self._context_depth == 0:
+            self.connect()
+        self._context_depth += 1
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.disconnect()
+        self._context_depth -= 1
+        if self._context_depth == 0:
+            self.disconnect()
 
     def disconnect(self):
-        """Disconnect from the database."""
-        if self.conn:
-            self.conn.close()
+        """Disconnect from the database, closing the file once no other manager has it open."""
+        if self._conn is not None:
+            _close_cursor(self.db_path, self._conn)
+            self._conn = None
             # Disconnected silently
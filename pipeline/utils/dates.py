@@ -0,0 +1,25 @@
+from datetime import date
+from typing import FrozenSet, Optional
+
+
+def get_current_seasons(today: Optional[date] = None, include_both_years: bool = False) -> FrozenSet[str]:
+    """
+    Get the season strings that are still ongoing and should not be scraped.
+    
+    FBref European-style seasons roll over in August, so from August onwards the
+    season starting this year is the current one, otherwise the one from last year.
+    Calendar-year leagues label their seasons by the year itself.
+    
+    Args:
+        today: Reference date, defaults to the current date
+        include_both_years: Include both calendar years the split-year season spans instead of
+                            only the current one; tournament editions of either year may still be running
+        
+    Returns:
+        Set with the split-year season (e.g., "2025-2026") and the calendar-year season(s) (e.g., "2025")
+    """
+    today = today or date.today()
+    start_year = today.year if today.month >= 8 else today.year - 1
+    if include_both_years:
+        return frozenset({f"{start_year}-{start_year + 1}", str(start_year), str(start_year + 1)})
+    return frozenset({f"{start_year}-{start_year + 1}", str(today.year)})
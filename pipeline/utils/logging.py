@@ -61,6 +61,11 @@ def get_logger(name: str = "fbref_pipeline") -> logging.Logger:
 class RelativePathFilter(logging.Filter):
     """Filter to add relative file path to log records."""
     
+    def __init__(self, name: str = ''):
+        super().__init__(name)
+        # Relative path per source file, so the project root is only searched for once per file
+        self._relative_paths = {}
+    
     def filter(self, record):
         """
         Add relative_path attribute to the log record.
@@ -71,13 +76,29 @@ class RelativePathFilter(logging.Filter):
         Returns:
             True to allow the record to be logged
         """
+        relative_path = self._relative_paths.get(record.pathname)
+        if relative_path is None:
+            relative_path = self._relative_paths[record.pathname] = self._resolve_relative_path(record)
+        record.relative_path = relative_path
+        return True
+    
+    @staticmethod
+    def _resolve_relative_path(record) -> str:
+        """
+        Work out the path of the record's source file relative to the project root.
+        
+        Args:
+            record: LogRecord instance
+            
+        Returns:
+            Relative path, or the bare filename if the project root cannot be found
+        """
         try:
             # Get the absolute path of the file
             abs_path = Path(record.pathname).resolve()
             
             # Get the project root (where pipeline/ directory is)
             # Go up from the current file until we find the pipeline directory
-            current = abs_path
             project_root = None
             
             # Try to find project root by looking for 'pipeline' directory
@@ -89,20 +110,17 @@ class RelativePathFilter(logging.Filter):
             if project_root:
                 # Get relative path from project root
                 try:
-                    rel_path = abs_path.relative_to(project_root)
-                    record.relative_path = str(rel_path)
+                    return str(abs_path.relative_to(project_root))
                 except ValueError:
                     # If relative_to fails, use the filename
-                    record.relative_path = record.filename
-            else:
-                # Fallback to just filename if we can't find project root
-                record.relative_path = record.filename
+                    return record.filename
+            
+            # Fallback to just filename if we can't find project root
+            return record.filename
                 
         except Exception:
             # If anything goes wrong, just use the filename
-            record.relative_path = record.filename
-        
-        return True
+            return record.filename
 
 def setup_logger(name: str, log_file: str = None, level: int = logging.INFO) -> logging.Logger:
     """
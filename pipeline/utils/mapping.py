@@ -358,6 +358,26 @@ STATS_MAPPING = {
     "gk_avg_distance_def_actions": "average_distance_defensive_actions",
 }
 
+TEAM_STATS_MAPPING = {
+    "possession": "possession%",
+    "passing accuracy": "passing_accuracy%",
+    "shots on target": "shots_on_target%",
+    "saves": "saves%",
+    "cards": "cards",
+    "fouls": "fouls",
+    "corners": "corners",
+    "crosses": "crosses",
+    "touches": "touches",
+    "tackles": "tackles",
+    "interceptions": "interceptions",
+    "aerials won": "aerials_won",
+    "clearances": "clearances",
+    "offsides": "offsides",
+    "goal kicks": "goal_kicks",
+    "throw ins": "throw_ins",
+    "long balls": "long_balls",
+}
+
 
 LEADER_TABLE_TYPE_MAPPING = {
     # Format: "key": ("div_id_for_parsing", "schema_table_name")
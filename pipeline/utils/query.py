@@ -206,26 +206,26 @@ class DatabaseQueries:
     
     # ==================== INSERT QUERIES ====================
     
-    # Insert competitions query template
-    INSERT_COMPETITIONS = """
-        INSERT INTO {table_name} ({columns}) VALUES ({placeholders})
+    # Upsert competitions from a registered DataFrame view query template (rows keyed by competition_id)
+    UPSERT_COMPETITIONS_FROM_VIEW = """
+        INSERT OR REPLACE INTO {table_name} ({columns}) SELECT {columns} FROM {view_name}
     """
     
-    # Insert seasons query template
+    # Insert seasons query template (replaces the competition's existing row)
     INSERT_SEASONS = """
-        INSERT INTO {table_name} (competition_name, competition_id, {struct_column})
+        INSERT OR REPLACE INTO {table_name} (competition_name, competition_id, {struct_column})
         VALUES (?, ?, ?)
     """
     
-    # Insert score tables query
+    # Insert score tables query (replaces the competition's existing row)
     INSERT_SCORE_TABLES = """
-        INSERT INTO score_table (competition_name, competition_id, score_tables)
+        INSERT OR REPLACE INTO score_table (competition_name, competition_id, score_tables)
         VALUES (?, ?, ?)
     """
     
-    # Insert tournament score tables query template
+    # Insert tournament score tables query template (replaces the competition's existing row)
     INSERT_TOURNAMENT_SCORE_TABLE = """
-        INSERT INTO {table_name} (competition_name, competition_id, score_tables)
+        INSERT OR REPLACE INTO {table_name} (competition_name, competition_id, score_tables)
         VALUES (?, ?, ?)
     """
 
@@ -248,9 +248,9 @@ class DatabaseQueries:
     
     # ==================== DELETE QUERIES ====================
     
-    # Delete competitions query template
-    DELETE_COMPETITIONS = """
-        DELETE FROM {table_name}
+    # Delete competitions missing from a registered DataFrame view query template
+    DELETE_COMPETITIONS_NOT_IN_VIEW = """
+        DELETE FROM {table_name} WHERE competition_id NOT IN (SELECT competition_id FROM {view_name})
     """
     
     # Delete seasons query template
@@ -285,14 +285,32 @@ class DatabaseQueries:
         SELECT seasons FROM season WHERE competition_id = ?
     """
     
+    # Get seasons of every domestic competition query
+    GET_ALL_DOMESTIC_SEASONS = """
+        SELECT s.competition_id, s.seasons
+        FROM season s
+        JOIN competition_club c ON c.competition_id = s.competition_id
+        WHERE c.competition_type = 'domestic'
+    """
+    
     # Get competitions query template
     GET_COMPETITIONS = """
         SELECT * FROM {table_name}
     """
     
+    # Get competition identity columns query template (skips the awards STRUCT array)
+    GET_COMPETITION_SUMMARIES = """
+        SELECT competition_name, competition_id, competition_type FROM {table_name}
+    """
+    
     # Get matches query
     GET_FIXTURES = """
-        SELECT * FROM fixture
+        SELECT competition_name, competition_id, fixtures FROM fixture
+    """
+    
+    # Get fixtures of one competition query
+    GET_FIXTURES_BY_COMPETITION = """
+        SELECT competition_name, competition_id, fixtures FROM fixture WHERE competition_id = ?
     """
     
     DELETE_MATCH_TABLES = """
@@ -329,13 +347,13 @@ class DatabaseQueries:
         ORDER BY st.competition_name, unnest.season
     """
     
-    # Get competition type queries
-    GET_COMPETITION_TYPE_NATION = """
-        SELECT COUNT(*) FROM competition_nation WHERE competition_id = ?
-    """
-    
-    GET_COMPETITION_TYPE_CLUB = """
-        SELECT competition_type FROM competition_club WHERE competition_id = ?
+    # Resolve a competition's type in one round-trip (binds the competition_id twice)
+    GET_COMPETITION_TYPE_COMBINED = """
+        SELECT CASE
+            WHEN EXISTS (SELECT 1 FROM competition_nation WHERE competition_id = ?) THEN 'national'
+            WHEN (SELECT competition_type FROM competition_club WHERE competition_id = ?) = 'international' THEN 'international'
+            ELSE 'domestic'
+        END
     """
 
     # Get table count query template
@@ -0,0 +1,71 @@
+import threading
+import time
+
+# Global rate limiter instance
+_rate_limiter = None
+_rate_limiter_lock = threading.Lock()
+
+
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces out requests to FBref by a minimum interval.
+
+    The interval adapts to the server: it doubles when FBref answers 429 or 503,
+    and eases back towards the base interval as requests succeed again.
+    """
+
+    # Responses that mean the server wants fewer requests
+    THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+    def __init__(self, min_interval: float = 1.0, max_interval: float = 60.0):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            min_interval: Minimum number of seconds between two requests
+            max_interval: Upper bound for the interval after repeated throttling
+        """
+        self.base_interval = min_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._lock = threading.Lock()
+        self._next_request_at = 0.0
+
+    def wait(self):
+        """Block until the caller is allowed to send the next request."""
+        with self._lock:
+            now = time.monotonic()
+            delay = self._next_request_at - now
+            self._next_request_at = max(now, self._next_request_at) + self.min_interval
+
+        if delay > 0:
+            time.sleep(delay)
+
+    def record_response(self, status_code: int):
+        """
+        Adapt the interval to a response from the server.
+
+        Args:
+            status_code: HTTP status code of the response
+        """
+        with self._lock:
+            if status_code in self.THROTTLE_STATUS_CODES:
+                self.min_interval = min(self.min_interval * 2, self.max_interval)
+            elif self.min_interval > self.base_interval:
+                self.min_interval = max(self.min_interval * 0.9, self.base_interval)
+
+
+def get_rate_limiter() -> RateLimiter:
+    """
+    Get or create the rate limiter shared by every scraper in the process.
+
+    Returns:
+        Shared RateLimiter instance
+    """
+    global _rate_limiter
+
+    with _rate_limiter_lock:
+        if _rate_limiter is None:
+            _rate_limiter = RateLimiter()
+
+    return _rate_limiter
@@ -1,78 +1,208 @@
 import requests
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-import time
-from typing import Optional
+from typing import Any, Callable, Optional, Iterator, List, Tuple, Dict
 from urllib.parse import urljoin
 from pipeline.utils.logging import get_logger
-from pipeline.utils.cache import CacheManager
+from pipeline.utils.cache import get_cache_manager
+from pipeline.utils.rate_limit import get_rate_limiter
 
 logger = get_logger()
 
+# Browser-like headers sent with every request
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1',
+    'Sec-Fetch-Dest': 'document',
+    'Sec-Fetch-Mode': 'navigate',
+    'Sec-Fetch-Site': 'none',
+    'Cache-Control': 'max-age=0'
+}
+
+# Global HTTP session instance
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get or create the HTTP session shared by every scraper in the process.
+    
+    The session keeps a keep-alive pool, so pages from fbref.com reuse open TCP/TLS
+    connections across scrapers, and retries transient server errors with backoff.
+    Throttling responses (429/503) are not retried here: they are returned to the caller,
+    whose RateLimiter.record_response() widens the spacing of all later requests.
+    
+    Returns:
+        Shared requests Session
+    """
+    global _session
+    
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            retries = Retry(
+                total=3,
+                backoff_factor=1.0,
+                status_forcelist=(500, 502, 504),
+                allowed_methods=frozenset({'GET', 'HEAD'}),
+            )
+            session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retries))
+            session.headers.update(_DEFAULT_HEADERS)
+            _session = session
+    
+    return _session
+
+
 class UniversalScraper:
     """Class for scraping FBref universal HTML content."""
     
-    def __init__(self, base_url: str = "https://fbref.com", pipeline_name: str = "universal"):
+    def __init__(self, base_url: str = "https://fbref.com", pipeline_name: str = "universal", parser: str = "lxml"):
         """
         Initialize the scraper.
         
         Args:
             base_url: Base URL for FBref
             pipeline_name: Name of the pipeline for cache management
+            parser: BeautifulSoup tree builder used for fetched pages; lxml builds large pages
+                    much faster than 'html.parser'
         """
         self.base_url = base_url
         self.pipeline_name = pipeline_name
-        self.cache_manager = CacheManager(pipeline_name)
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-            'Accept-Encoding': 'gzip, deflate, br',
-            'Connection': 'keep-alive',
-            'Upgrade-Insecure-Requests': '1',
-            'Sec-Fetch-Dest': 'document',
-            'Sec-Fetch-Mode': 'navigate',
-            'Sec-Fetch-Site': 'none',
-            'Cache-Control': 'max-age=0'
-        })
+        self.parser = parser
+        self.cache_manager = get_cache_manager(pipeline_name)
+        self.rate_limiter = get_rate_limiter()
+        # Per-thread (url, html, etag, last_modified) pages held back while a batched_cache_writes() block is open;
+        # thread-local so threads sharing this scraper never flush or drop each other's pages
+        self._batch = threading.local()
+        self.session = get_session()
     
-    def get_page(self, url: str, use_cache: bool = True) -> Optional[BeautifulSoup]:
+    def get_html(self, url: str, use_cache: bool = True, cache_writes: Optional[List[Tuple[str, str, Optional[str], Optional[str]]]] = None) -> Optional[str]:
         """
-        Fetch a page and return BeautifulSoup object.
+        Fetch a page and return its raw HTML.
         
         Args:
             url: URL to fetch
             use_cache: Whether to use cached HTML if available
+            cache_writes: List to collect the fetched page in instead of caching it; the caller stores
+                          it with cache_html_many
             
         Returns:
-            BeautifulSoup object or None if failed
+            HTML content or None if failed
         """
         try:
             if use_cache:
                 cached_html = self.cache_manager.get_cached_html(url)
                 if cached_html:
                     logger.info(f"[CACHE] - {url}")
-                    return BeautifulSoup(cached_html, 'html.parser')
+                    return cached_html
+            
+            # A page refetched past the cache is revalidated, so an unchanged page costs a 304, not a full download
+            headers = self._conditional_headers(url) if not use_cache else None
             
             logger.info(f"Fetching: {url}")
-            response = self.session.get(url, timeout=30)
+            self.rate_limiter.wait()  # Be respectful to the server
+            response = self.session.get(url, timeout=30, headers=headers)
+            self.rate_limiter.record_response(response.status_code)
+            
+            if response.status_code == 304:
+                cached_html = self.cache_manager.get_cached_html(url)
+                if cached_html:
+                    self.cache_manager.mark_revalidated(url)
+                    logger.info(f"[NOT MODIFIED] - {url}")
+                    return cached_html
+                # The cached copy is gone; fetch the page unconditionally
+                self.rate_limiter.wait()
+                response = self.session.get(url, timeout=30)
+                self.rate_limiter.record_response(response.status_code)
+            
             response.raise_for_status()
             html_content = response.text
-            soup = BeautifulSoup(html_content, 'html.parser')
             
-            if use_cache:
-                self.cache_manager.cache_html(url, html_content)
+            # Refetched pages replace the cached copy too, keeping its validators current
+            page = (url, html_content, response.headers.get('ETag'), response.headers.get('Last-Modified'))
+            pending = cache_writes if cache_writes is not None else getattr(self._batch, 'pages', None)
+            if pending is not None:
+                pending.append(page)
+            else:
+                self.cache_manager.cache_html(*page)
             
-            time.sleep(1)  # Be respectful to the server
-            return soup
+            return html_content
             
         except requests.RequestException as e:
             logger.error(f"Failed to fetch {url}: {e}")
             return None
     
-    def scrape_season_page(self, link: str, season: str, competition_name: str, competition_id: int, use_cache: bool = True) -> Optional[BeautifulSoup]:
+    def _conditional_headers(self, url: str) -> Optional[Dict[str, str]]:
         """
-        Scrape the HTML content for a specific page.
+        Build If-None-Match / If-Modified-Since headers from the validators of a cached page.
+        
+        Args:
+            url: URL about to be fetched
+            
+        Returns:
+            Conditional request headers, or None if the page has no stored validators
+        """
+        validators = self.cache_manager.get_validators(url)
+        if not validators:
+            return None
+        
+        etag, last_modified = validators
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+    
+    @contextmanager
+    def batched_cache_writes(self) -> Iterator[None]:
+        """
+        Hold back cache writes made inside the block and store them in one transaction on exit.
+        
+        Pages fetched before an error are still cached, since the flush runs on any exit.
+        Batching is per thread: only pages fetched by the calling thread are held back.
+        """
+        if getattr(self._batch, 'pages', None) is not None:
+            # Already batching; the outermost block flushes
+            yield
+            return
+        
+        self._batch.pages = []
+        try:
+            yield
+        finally:
+            pending, self._batch.pages = self._batch.pages, None
+            self.cache_manager.cache_html_many(pending)
+    
+    def get_page(self, url: str, use_cache: bool = True) -> Optional[BeautifulSoup]:
+        """
+        Fetch a page and return BeautifulSoup object.
+        
+        Args:
+            url: URL to fetch
+            use_cache: Whether to use cached HTML if available
+            
+        Returns:
+            BeautifulSoup object or None if failed
+        """
+        html_content = self.get_html(url, use_cache=use_cache)
+        if not html_content:
+            return None
+        return BeautifulSoup(html_content, self.parser)
+    
+    def scrape_season_html(self, link: str, season: str, competition_name: str, competition_id: int, use_cache: bool = True,
+                           cache_writes: Optional[List[Tuple[str, str, Optional[str], Optional[str]]]] = None) -> Optional[str]:
+        """
+        Scrape the raw HTML for a specific page.
         
         Args:
             link: Link to scrape
@@ -80,18 +210,94 @@ class UniversalScraper:
             competition_name: Name of the competition
             competition_id: ID of the competition
             use_cache: Whether to use cached HTML if available
+            cache_writes: List to collect the fetched page in instead of caching it (see get_html)
             
         Returns:
-            BeautifulSoup object or None if failed
+            HTML content or None if failed
         """
         logger.info(f"Scraping {competition_name} {season} page...")
         
         # Construct full URL
         full_url = urljoin(self.base_url, link)
         
-        soup = self.get_page(full_url, use_cache=use_cache)
-        if not soup:
+        html_content = self.get_html(full_url, use_cache=use_cache, cache_writes=cache_writes)
+        if not html_content:
             logger.error(f"Failed to fetch page: {full_url}")
             return None
         
-        return soup
+        return html_content
+    
+    def scrape_season_page(self, link: str, season: str, competition_name: str, competition_id: int, use_cache: bool = True) -> Optional[BeautifulSoup]:
+        """
+        Scrape the HTML content for a specific page.
+        
+        Args:
+            link: Link to scrape
+            season: Season string (e.g., "2024-2025")
+            competition_name: Name of the competition
+            competition_id: ID of the competition
+            use_cache: Whether to use cached HTML if available
+            
+        Returns:
+            BeautifulSoup object or None if failed
+        """
+        html_content = self.scrape_season_html(link, season, competition_name, competition_id, use_cache=use_cache)
+        if not html_content:
+            return None
+        
+        return BeautifulSoup(html_content, self.parser)
+    
+    def collect_season_pages(self, seasons: List[Dict[str, Any]], is_current_season: Callable[[str], bool], competition_name: str) -> List[Tuple[str, str, bool]]:
+        """
+        Collect the season pages to fetch, skipping ongoing seasons and logging seasons without a link.
+        
+        Args:
+            seasons: Season records of a competition
+            is_current_season: Tells whether a season is still ongoing and should be skipped
+            competition_name: Name of the competition
+            
+        Returns:
+            List of (season, link, use_cache) tuples in the order given, ready for scrape_season_htmls
+        """
+        pending_seasons = [
+            (season_data.get('season'), season_data.get('season_link'), True)
+            for season_data in seasons
+            if season_data.get('season_link') and not is_current_season(season_data.get('season'))
+        ]
+        missing_links = [str(season_data.get('season')) for season_data in seasons if not season_data.get('season_link')]
+        if missing_links:
+            logger.warning(f"No season link for {competition_name} {', '.join(missing_links)}")
+        return pending_seasons
+    
+    def scrape_season_htmls(self, pages: List[Tuple[str, str, bool]], competition_name: str, competition_id: int, max_workers: int = 8) -> List[Optional[str]]:
+        """
+        Scrape the raw HTML of many season pages concurrently.
+        
+        The shared rate limiter still spaces out the requests; the threads only overlap
+        the waiting on the network. Pages are cached in one transaction once all are fetched.
+        
+        Args:
+            pages: List of (season, link, use_cache) tuples
+            competition_name: Name of the competition
+            competition_id: ID of the competition
+            max_workers: Number of pages to fetch at the same time; 1 fetches them on the calling thread
+            
+        Returns:
+            HTML content of each page in the order given, None for pages that failed
+        """
+        if not pages:
+            return []
+        
+        # Fetched pages of this call only; list.append is safe across the worker threads
+        cache_writes = []
+        fetch = lambda page: self.scrape_season_html(
+            page[1], page[0], competition_name, competition_id, use_cache=page[2], cache_writes=cache_writes
+        )
+        try:
+            if max_workers <= 1:
+                # Callers that already run in a pool fetch on their own thread
+                return [fetch(page) for page in pages]
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(fetch, pages))
+        finally:
+            self.cache_manager.cache_html_many(cache_writes)
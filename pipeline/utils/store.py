@@ -0,0 +1,68 @@
+from typing import Any, Callable, List, Tuple
+from pipeline.utils.logging import get_logger
+
+logger = get_logger()
+
+# Scraped competitions held in memory before they are stored; bounds what a crash can lose
+STORE_BATCH_SIZE = 5
+
+
+class BatchedStore:
+    """
+    Store scraped competitions in bounded batches.
+
+    Each batch is written with one bulk insert. If that fails, its competitions are stored
+    one by one, so a bad row only loses itself. Leaving the `with` block stores whatever is
+    still pending, also when the run is interrupted.
+    """
+
+    def __init__(self, store_many: Callable[[List[Tuple[Any, ...]]], None], store_one: Callable[..., None], batch_size: int = STORE_BATCH_SIZE):
+        """
+        Initialize the store.
+
+        Args:
+            store_many: Bulk insert taking a list of (competition_name, competition_id, data) rows
+            store_one: Insert for a single competition, called with the values of one row
+            batch_size: Number of competitions stored per bulk insert
+        """
+        self.store_many = store_many
+        self.store_one = store_one
+        self.batch_size = batch_size
+        self.pending: List[Tuple[Any, ...]] = []
+        # Number of competitions that could not be stored
+        self.failed = 0
+
+    def add(self, row: Tuple[Any, ...]):
+        """
+        Queue one competition, storing the batch once it is full.
+
+        Args:
+            row: (competition_name, competition_id, data) tuple
+        """
+        self.pending.append(row)
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Store the pending competitions, falling back to one insert per competition if the batch fails."""
+        rows, self.pending = self.pending, []
+        if not rows:
+            return
+
+        try:
+            self.store_many(rows)
+        except Exception:
+            # The insert already logged the error; isolate the bad rows so the rest are still stored
+            for row in rows:
+                try:
+                    self.store_one(*row)
+                except Exception:
+                    self.failed += 1
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit, storing what is left."""
+        self.flush()